@@ -0,0 +1 @@
+"""Summer Job Matcher: scraping dos sites de professores, análise com o Gemini e dashboard."""
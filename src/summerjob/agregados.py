@@ -0,0 +1,201 @@
+"""
+Agregados materializados de fit por universidade, área (tag normalizada) e modelo,
+um conjunto por perfil de candidato.
+
+A tabela guarda, para cada (dimensão, valor, fit): quantos professores e a soma/contagem
+do score numérico, de onde sai a média. Ela é atualizada incrementalmente a cada
+resultado gravado (`atualizar`, chamado por `main.aplicar_resultado`), e reconstruída do
+zero quando a base muda por fora (reset, ingestão, edição manual): o banco guarda o mtime
+da base com que está em dia (`em_dia`/`marcar_em_dia`, gravado por `base_mestra.salvar_base`).
+Um delta que deixaria uma contagem negativa também indica que a tabela se perdeu da base.
+O dashboard lê daqui os totais e gráficos em vez de varrer todas as linhas.
+"""
+import logging
+import os
+import re
+import sqlite3
+
+import pandas as pd
+
+from summerjob.respostas import extrair_score
+from summerjob.config import DIMENSOES_AGREGADOS, PERFIL_PADRAO, snapshot_path, agregados_db
+
+SEM_FIT = "Pendente"
+
+# Grafias/abreviações encontradas na coluna Area -> tag canônica
+ALIASES_AREA = {
+    'ml': 'machine learning',
+    'ds ml': 'machine learning',
+    'ai': 'artificial intelligence',
+    'hpc': 'high performance computing',
+    'sci comp': 'scientific computing',
+    'numerial computing': 'numerical computing',
+    'numeric computing': 'numerical computing',
+    'numerical computations': 'numerical computing',
+    'medcine': 'medicine',
+    'biomedics': 'biomedical',
+    'discrete maths': 'discrete math',
+    'operational research': 'operations research',
+}
+
+def normalizar_areas(area):
+    """Quebra o texto livre de Area em tags normalizadas (minúsculas, sem duplicatas)."""
+    if not isinstance(area, str):
+        return []
+    tags = []
+    for parte in re.split(r'[,;/]|\band\b', area.lower()):
+        tag = ' '.join(parte.split())
+        tag = ALIASES_AREA.get(tag, tag)
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+def _texto(valor, padrao):
+    return str(valor).strip() if pd.notna(valor) and str(valor).strip() else padrao
+
+def score_da_linha(linha):
+    """Score numérico da linha; se a coluna estiver vazia, extrai do relatório."""
+    score = linha.get('Score')
+    if score is not None and pd.notna(score):
+        return float(score)
+    score = extrair_score(linha.get('Justificativa'))
+    return float(score) if score is not None else None
+
+def _contribuicoes(linha):
+    """Chaves (dimensao, valor, fit) que uma linha da base mestra alimenta, e o seu score."""
+    fit = _texto(linha.get('Fit'), SEM_FIT)
+    chaves = [('geral', 'Todos', fit),
+              ('universidade', _texto(linha.get('Universidade'), 'N/A'), fit),
+              ('modelo', _texto(linha.get('Modelo'), 'N/A'), fit)]
+    chaves += [('area', tag, fit) for tag in normalizar_areas(linha.get('Area'))]
+    return chaves, score_da_linha(linha)
+
+def _conectar(perfil):
+    os.makedirs(snapshot_path(perfil), exist_ok=True)
+    conn = sqlite3.connect(agregados_db(perfil))
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS agregados (
+            dimensao TEXT, valor TEXT, fit TEXT,
+            n INTEGER, soma_score REAL, n_score INTEGER,
+            PRIMARY KEY (dimensao, valor, fit)
+        )""")
+    conn.execute("CREATE TABLE IF NOT EXISTS meta (chave TEXT PRIMARY KEY, valor REAL)")
+    return conn
+
+def _somar(deltas, linha, sinal):
+    chaves, score = _contribuicoes(linha)
+    for chave in chaves:
+        n, soma, n_score = deltas.get(chave, (0, 0.0, 0))
+        if score is not None:
+            soma += sinal * score
+            n_score += sinal
+        deltas[chave] = (n + sinal, soma, n_score)
+
+def _aplicar_deltas(conn, deltas):
+    """Soma os deltas na tabela. Retorna False se alguma contagem ficaria negativa
+    (a tabela não corresponde à base); nesse caso nada é gravado."""
+    conn.execute("SAVEPOINT deltas")
+    conn.executemany("""
+        INSERT INTO agregados (dimensao, valor, fit, n, soma_score, n_score) VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT (dimensao, valor, fit) DO UPDATE SET
+            n = n + excluded.n,
+            soma_score = soma_score + excluded.soma_score,
+            n_score = n_score + excluded.n_score
+        """, [(*chave, *valores) for chave, valores in deltas.items() if any(valores)])
+    if conn.execute("SELECT 1 FROM agregados WHERE n < 0 OR n_score < 0 LIMIT 1").fetchone():
+        conn.execute("ROLLBACK TO deltas")
+        conn.execute("RELEASE deltas")
+        return False
+    conn.execute("DELETE FROM agregados WHERE n = 0")
+    conn.execute("RELEASE deltas")
+    return True
+
+def existem(perfil=PERFIL_PADRAO):
+    return os.path.exists(agregados_db(perfil))
+
+def em_dia(perfil, mtime):
+    """True se os agregados existem e foram mantidos junto com a versão `mtime` da base."""
+    if not existem(perfil):
+        return False
+    with _conectar(perfil) as conn:
+        linha = conn.execute("SELECT valor FROM meta WHERE chave = 'mtime_base'").fetchone()
+    return linha is not None and linha[0] == mtime
+
+def marcar_em_dia(perfil, mtime):
+    """Registra que os agregados correspondem à versão `mtime` da base recém-gravada."""
+    if not existem(perfil):
+        return
+    with _conectar(perfil) as conn:
+        conn.execute("INSERT OR REPLACE INTO meta (chave, valor) VALUES ('mtime_base', ?)", (mtime,))
+
+def reconstruir(df, perfil=PERFIL_PADRAO, mtime=None):
+    """Recalcula todos os agregados do perfil a partir da base inteira.
+
+    `mtime` é a versão da base em disco a que `df` corresponde (None se `df` tem
+    alterações ainda não gravadas: aí quem gravar a base chama `marcar_em_dia`).
+    """
+    deltas = {}
+    for linha in df.to_dict('records'):
+        _somar(deltas, linha, +1)
+    with _conectar(perfil) as conn:
+        conn.execute("DELETE FROM agregados")
+        conn.execute("DELETE FROM meta")
+        _aplicar_deltas(conn, deltas)
+        if mtime is not None:
+            conn.execute("INSERT INTO meta (chave, valor) VALUES ('mtime_base', ?)", (mtime,))
+
+def atualizar(antes, depois, perfil=PERFIL_PADRAO, base=None):
+    """Atualização incremental: tira a contribuição antiga da linha e soma a nova.
+
+    Se a tabela se perdeu da base (contagem ficaria negativa), reconstrói a partir de
+    `base` (o DataFrame já com a linha nova); sem `base`, descarta os agregados para
+    a próxima leitura da base reconstruí-los.
+    """
+    deltas = {}
+    if antes is not None:
+        _somar(deltas, antes, -1)
+    _somar(deltas, depois, +1)
+    with _conectar(perfil) as conn:
+        ok = _aplicar_deltas(conn, deltas)
+    if ok:
+        return
+    logging.warning(f"Agregados do perfil '{perfil}' fora de sincronia com a base; reconstruindo.")
+    if base is not None:
+        reconstruir(base, perfil)
+    else:
+        os.remove(agregados_db(perfil))
+
+def ler(dimensao, perfil=PERFIL_PADRAO):
+    """Linhas cruas (valor, fit, n, soma_score, n_score) de uma dimensão."""
+    if dimensao not in DIMENSOES_AGREGADOS:
+        raise ValueError(f"Dimensão desconhecida: {dimensao} (use {', '.join(DIMENSOES_AGREGADOS)})")
+    colunas = ['valor', 'fit', 'n', 'soma_score', 'n_score']
+    if not existem(perfil):
+        return pd.DataFrame(columns=colunas)
+    with _conectar(perfil) as conn:
+        return pd.read_sql_query(
+            "SELECT valor, fit, n, soma_score, n_score FROM agregados WHERE dimensao = ?",
+            conn, params=(dimensao,))
+
+def cobertura(perfil=PERFIL_PADRAO):
+    """(analisados, total) do perfil: professores com algum Fit (inclusive Erro) sobre a base toda."""
+    dados = ler('geral', perfil)
+    total = int(dados['n'].sum())
+    return int(dados.loc[dados['fit'] != SEM_FIT, 'n'].sum()), total
+
+def resumo(dimensao, fits=None, perfil=PERFIL_PADRAO):
+    """Tabela por valor da dimensão: contagem por fit, total e score médio.
+
+    `fits` restringe os níveis de fit considerados (ex: os selecionados no filtro).
+    """
+    dados = ler(dimensao, perfil)
+    if fits is not None:
+        dados = dados[dados['fit'].isin(fits)]
+    if dados.empty:
+        return pd.DataFrame()
+
+    contagens = dados.pivot_table(index='valor', columns='fit', values='n', aggfunc='sum', fill_value=0)
+    somas = dados.groupby('valor')[['n', 'soma_score', 'n_score']].sum()
+    contagens['Total'] = somas['n']
+    contagens['Score Médio'] = (somas['soma_score'] / somas['n_score'].where(somas['n_score'] > 0)).round(1)
+    return contagens.sort_values('Total', ascending=False)
@@ -0,0 +1,189 @@
+import os
+from dotenv import load_dotenv
+import logging
+import time
+from summerjob.config import ENV_FILE, PERFIL_PADRAO
+from summerjob.perfis import carregar_perfil
+from summerjob.respostas import extrair_fit
+
+# Carrega variáveis de ambiente do arquivo .env
+load_dotenv(ENV_FILE)
+
+API_KEY = os.getenv("GEMINI_API_KEY")
+
+if not API_KEY:
+    logging.warning("GEMINI_API_KEY não encontrada no arquivo .env")
+
+_genai = None
+
+def get_genai():
+    """Importa e configura o SDK do Gemini só no primeiro uso (o import é pesado)."""
+    global _genai
+    if _genai is None:
+        import google.generativeai as genai
+        genai.configure(api_key=API_KEY)
+        _genai = genai
+    return _genai
+
+# Orçamento de geração por modelo. Modelos com "thinking" (2.5/3) gastam parte do
+# max_output_tokens raciocinando, então precisam de um teto maior para não truncar o relatório.
+DEFAULT_GENERATION_CONFIG = {'max_output_tokens': 1024, 'temperature': 0.2}
+MODEL_GENERATION_CONFIG = {
+    'gemini-2.5-flash': {'max_output_tokens': 4096},
+    'gemini-3-flash-preview': {'max_output_tokens': 4096},
+    'gemini-3-pro-preview': {'max_output_tokens': 4096},
+    'gemma-3-27b-it': {'temperature': 0.3},
+}
+
+def get_generation_config(model_name):
+    """Config de geração do modelo; GEMINI_MAX_OUTPUT_TOKENS / GEMINI_TEMPERATURE no .env sobrescrevem tudo."""
+    config = {**DEFAULT_GENERATION_CONFIG, **MODEL_GENERATION_CONFIG.get(model_name, {})}
+    if os.getenv("GEMINI_MAX_OUTPUT_TOKENS"):
+        config['max_output_tokens'] = int(os.getenv("GEMINI_MAX_OUTPUT_TOKENS"))
+    if os.getenv("GEMINI_TEMPERATURE"):
+        config['temperature'] = float(os.getenv("GEMINI_TEMPERATURE"))
+    return config
+
+def eh_erro_de_cota(e):
+    """True se a exceção indica cota excedida (429 / resource exhausted)."""
+    err_str = str(e).lower()
+    return "429" in err_str or "quota" in err_str or "resource exhausted" in err_str
+
+def _uso_vazio():
+    return {'modelo': None, 'tokens_prompt': None, 'tokens_resposta': None, 'tempo': 0.0}
+
+def analyze_profile(website_content, on_fit=None, perfil_candidato=None):
+    """Avalia o fit do candidato com o site do professor.
+
+    `perfil_candidato` é o texto do perfil (ver data/perfis/); sem ele, usa o perfil padrão.
+    A resposta é recebida em streaming; `on_fit(categoria)` é chamado assim que a
+    classificação aparece no texto. Retorna (relatorio, fit_categoria, uso), onde `uso`
+    traz o modelo usado, os tokens de prompt/resposta e o tempo da chamada.
+    """
+    if not API_KEY:
+        return "Erro: API Key não configurada", "N/A", _uso_vazio()
+    
+    if not website_content or len(website_content) < 50:
+        return "Conteúdo insuficiente para análise.", "N/A", _uso_vazio()
+
+    if perfil_candidato is None:
+        perfil_candidato = carregar_perfil(PERFIL_PADRAO)
+
+    prompt_avaliacao = f"""
+Atue como um Recrutador Técnico Sênior e Especialista em Carreira de Dados (Data Science, ML e Engenharia de Dados).
+
+Sua tarefa é avaliar o "Job Fit" (Compatibilidade) entre o perfil do candidato descrito abaixo e as informações coletadas do site de um professor (Research Interests/Projects).
+
+### PERFIL DO CANDIDATO (CONTEXTO)
+{perfil_candidato.strip()}
+
+### CONTEÚDO DO SITE DO PROFESSOR
+{website_content[:8000]} 
+
+### INSTRUÇÕES DE SAÍDA
+Analise o conteúdo do site e retorne, NESTA ORDEM:
+
+1. **Classificação Final:** (OBRIGATÓRIO, na primeira linha: Escolha APENAS UMA das opções: "Fit Muito Alto", "Fit Alto", "Fit Baixo", "Fit Muito Baixo")
+2. **Score de Compatibilidade (0-100%):**
+3. **Pontos Fortes (Match):**
+4. **Gaps (Lacunas):**
+5. **Veredito:**
+
+Responda de forma direta e concisa (no máximo ~250 palavras).
+"""
+
+    # Tenta usar um modelo mais recente (Flash é mais rápido e economico, 1.5 Pro é mais robusto)
+    # Atualizado com modelos disponíveis no log do usuário (2.0/2.5 e Latest)
+    model_candidates = [
+        # Modelos Lite/Flash (Geralmente mais rápidos e com cotas melhores)
+        'gemini-2.5-flash-lite',
+        'gemini-2.0-flash-lite-preview-02-05',
+        'gemini-flash-lite-latest',
+        'gemini-3-flash-preview',
+        'gemini-2.5-flash',
+        
+        # Modelos Standard/Pro
+        'gemini-2.0-flash', 
+        'gemini-flash-latest',
+        'gemini-1.5-flash',
+        
+        # Modelos Alternativos (Gemma/Outros Previews)
+        'gemma-3-27b-it',
+        'gemini-3-pro-preview',
+    ]
+    
+    genai = get_genai()
+    response = None
+    text_response = ""
+    last_error = None
+    uso = _uso_vazio()
+
+    for model_name in model_candidates:
+        try:
+            model = genai.GenerativeModel(model_name)
+            t0 = time.perf_counter()
+            
+            # Executa diretamente sem retries (pedida do usuário para falhar rápido em caso de cota)
+            response = model.generate_content(
+                prompt_avaliacao,
+                generation_config=genai.types.GenerationConfig(**get_generation_config(model_name)),
+                stream=True,
+            )
+
+            partes = []
+            fit_parcial = None
+            for chunk in response:
+                try:
+                    partes.append(chunk.text)
+                except ValueError:
+                    continue # Chunk sem texto (ex: só metadados/finish_reason)
+                if fit_parcial is None:
+                    fit_parcial = extrair_fit("".join(partes), final=False)
+                    if fit_parcial and on_fit:
+                        on_fit(fit_parcial)
+
+            text_response = "".join(partes)
+            if not text_response:
+                raise ValueError("Resposta vazia do modelo")
+
+            uso['modelo'] = model_name
+            uso['tempo'] = time.perf_counter() - t0
+            usage = getattr(response, 'usage_metadata', None)
+            if usage:
+                uso['tokens_prompt'] = usage.prompt_token_count
+                uso['tokens_resposta'] = usage.candidates_token_count
+            break # Sucesso, sai do loop de modelos
+            
+        except Exception as e:
+            last_error = e
+            
+            # Se for erro de cota (429), propaga o erro imediatamente para parar o script
+            if eh_erro_de_cota(e):
+                logging.error(f"❌ Cota excedida no modelo {model_name}. Interrompendo script imediatamente.")
+                raise e
+            
+            # Outros erros (ex: modelo não encontrado, erro interno), tenta o próximo modelo
+            logging.warning(f"Falha ao usar modelo {model_name}: {str(e)}")
+            response = None
+            continue
+
+    if not response:
+        # Se falhar com todos, tenta listar os disponíveis para debug
+        try:
+            logging.error("Todos os modelos falharam. Listando modelos disponíveis...")
+            for m in genai.list_models():
+                if 'generateContent' in m.supported_generation_methods:
+                    logging.info(f"Modelo disponível: {m.name}")
+        except Exception as e_list:
+            logging.error(f"Não foi possível listar modelos: {e_list}")
+            
+        return f"Erro na análise (Todos modelos falharam): {last_error}", "Erro", uso
+
+    try:
+        # Extrair a classificação final de forma simples
+        fit_category = extrair_fit(text_response)
+        return text_response, fit_category, uso
+
+    except Exception as e:
+        logging.error(f"Erro na API do Gemini: {e}")
+        return f"Erro na análise: {e}", "Erro", uso
@@ -0,0 +1,101 @@
+"""
+Leitura e gravação da base de professores com os resultados de um perfil de candidato.
+
+Os dados dos professores (nome, universidade, área, site) vivem só na base mestra.
+Cada perfil, inclusive o padrão, guarda só as colunas de resultado em
+data/resultados/<perfil>.csv, ligadas pela chave do professor: gravar os resultados de
+um perfil não mexe na base mestra, então não invalida os agregados e snapshots dos
+outros. Assim o resto do código trabalha sempre com o mesmo formato de DataFrame,
+independente do perfil.
+"""
+import hashlib
+import os
+
+import pandas as pd
+
+from summerjob import agregados
+from summerjob.config import MASTER_CSV, PERFIL_PADRAO, RESULTADOS_PATH, resultados_csv
+
+COLUNAS_RESULTADO = ['Fit', 'Justificativa', 'Modelo', 'Tokens_Prompt', 'Tokens_Resposta', 'Score']
+
+def chave_professor(professor, website):
+    """Chave estável de um professor (Website normalizado + nome)."""
+    site = str(website).strip().rstrip('/').lower() if pd.notna(website) else ''
+    nome = str(professor).strip().lower() if pd.notna(professor) else ''
+    return hashlib.sha1(f"{site}|{nome}".encode('utf-8')).hexdigest()[:16]
+
+def garantir_colunas(df_master):
+    """Cria as colunas de resultado que ainda não existem na base mestra."""
+    # Custo da análise por linha em Modelo (e tokens de prompt/resposta abaixo).
+    # Coluna toda vazia vem do CSV como float: força texto para aceitar os resultados
+    for col in ['Fit', 'Justificativa', 'Modelo']:
+        if col not in df_master.columns: df_master[col] = None
+        df_master[col] = df_master[col].astype(object)
+    # Score de Compatibilidade (0-100) extraído do relatório, usado nos agregados
+    for col in ['Tokens_Prompt', 'Tokens_Resposta', 'Score']:
+        if col not in df_master.columns: df_master[col] = pd.NA
+        df_master[col] = df_master[col].astype('Int64')
+
+def mtime_base(perfil=PERFIL_PADRAO):
+    """Última modificação da base do perfil (base mestra ou arquivo de resultados)."""
+    caminhos = [MASTER_CSV, resultados_csv(perfil)]
+    return max((os.path.getmtime(c) for c in caminhos if os.path.exists(c)), default=0)
+
+def _gravar_resultados(df, perfil):
+    os.makedirs(RESULTADOS_PATH, exist_ok=True)
+    df[['Chave', 'Professor', 'Website'] + COLUNAS_RESULTADO].to_csv(resultados_csv(perfil), index=False)
+
+def migrar_resultados_padrao():
+    """Bases antigas guardavam os resultados do perfil padrão (e a ingestão ainda traz
+    Fit/Justificativa dos CSVs antigos) nas colunas da base mestra: na primeira vez,
+    move essas colunas para data/resultados/padrao.csv. Retorna True se migrou."""
+    if os.path.exists(resultados_csv(PERFIL_PADRAO)) or not os.path.exists(MASTER_CSV):
+        return False
+    df = pd.read_csv(MASTER_CSV)
+    colunas = [c for c in COLUNAS_RESULTADO if c in df.columns]
+    if not colunas:
+        return False
+    df['Chave'] = [chave_professor(p, w) for p, w in zip(df['Professor'], df['Website'])]
+    garantir_colunas(df)
+    _gravar_resultados(df, PERFIL_PADRAO)
+    df.drop(columns=['Chave'] + COLUNAS_RESULTADO).to_csv(MASTER_CSV, index=False)
+    print(f"📦 Resultados do perfil '{PERFIL_PADRAO}' movidos da base mestra para {resultados_csv(PERFIL_PADRAO)}")
+    return True
+
+def carregar_base(perfil=PERFIL_PADRAO):
+    """Base mestra com a coluna Chave e as colunas de resultado do perfil (None se não existe)."""
+    if perfil == PERFIL_PADRAO:
+        migrar_resultados_padrao()
+    if not os.path.exists(MASTER_CSV):
+        return None
+    df = pd.read_csv(MASTER_CSV)
+    df['Chave'] = [chave_professor(p, w) for p, w in zip(df['Professor'], df['Website'])]
+
+    # Colunas de resultado que sobrarem na base mestra (ingestão nova) não valem para perfil nenhum
+    df = df.drop(columns=[c for c in COLUNAS_RESULTADO if c in df.columns])
+    caminho = resultados_csv(perfil)
+    if os.path.exists(caminho):
+        resultados = pd.read_csv(caminho)
+        colunas = ['Chave'] + [c for c in COLUNAS_RESULTADO if c in resultados.columns]
+        df = df.merge(resultados[colunas].drop_duplicates('Chave'), on='Chave', how='left')
+
+    garantir_colunas(df)
+    return df
+
+def salvar_base(df, perfil=PERFIL_PADRAO):
+    """Grava os resultados do perfil em data/resultados/<perfil>.csv.
+
+    Quem grava por aqui manteve os agregados junto (`main.aplicar_resultado`), então eles
+    ficam marcados como em dia com esta versão da base.
+    """
+    _gravar_resultados(df, perfil)
+    agregados.marcar_em_dia(perfil, mtime_base(perfil))
+
+def garantir_agregados(df, perfil=PERFIL_PADRAO):
+    """Reconstrói os agregados a partir de `df` (a base recém-lida do disco) se eles não
+    existem ou se a base foi alterada por fora desde a última atualização. Retorna True se reconstruiu."""
+    mtime = mtime_base(perfil)
+    if agregados.em_dia(perfil, mtime):
+        return False
+    agregados.reconstruir(df, perfil, mtime)
+    return True
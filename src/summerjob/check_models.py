@@ -0,0 +1,30 @@
+import os
+from dotenv import load_dotenv
+from summerjob.config import ENV_FILE
+
+def listar_modelos():
+    # Carrega a API Key do .env
+    load_dotenv(ENV_FILE)
+    api_key = os.getenv("GEMINI_API_KEY")
+
+    if not api_key:
+        print("Erro: API Key não encontrada.")
+        return
+
+    # Import pesado: só acontece quando realmente vamos consultar a API
+    import google.generativeai as genai
+    genai.configure(api_key=api_key)
+
+    print("--- CONSULTANDO MODELOS DISPONÍVEIS ---")
+    try:
+        # Lista todos os modelos disponíveis para a sua chave
+        for m in genai.list_models():
+            # Filtra apenas os que servem para gerar texto (generateContent)
+            if 'generateContent' in m.supported_generation_methods:
+                print(f"- {m.name}")
+
+    except Exception as e:
+        print(f"Erro ao listar modelos: {e}")
+
+if __name__ == "__main__":
+    listar_modelos()
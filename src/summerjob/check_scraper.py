@@ -0,0 +1,209 @@
+import argparse
+import csv
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from summerjob.config import MASTER_CSV, DATA_PATH
+from summerjob.scraper import scrape_website
+
+PROFILES_PATH = os.path.join(DATA_PATH, 'profiles')
+
+def teste_real(url=None):
+    print("🕵️  Teste de Visão do Scraper")
+    
+    # Se passar URL como argumento, usa ela. Senão pede input.
+    if url is None:
+        try:
+            url = input("Cole a URL do site do professor aqui: ").strip()
+        except EOFError:
+            print("Erro: Nenhuma entrada recebida.")
+            return
+
+    if not url:
+        print("URL vazia.")
+        return
+
+    print(f"\n--- Acessando {url} ---")
+    try:
+        texto = scrape_website(url)
+    except Exception as e:
+        print(f"Erro crítico ao chamar scrape_website: {e}")
+        return
+
+    if not texto:
+        print("❌ O scraper não conseguiu ler NADA (retornou vazio ou None).")
+        print("Motivo provável: Site exige JavaScript, bloqueia bots ou URL inválida.")
+    else:
+        print(f"✅ Sucesso! Extraídos {len(texto)} caracteres.")
+        print("\n--- O QUE A IA VAI LER (Primeiros 500 chars) ---")
+        print(texto[:500])
+        print("\n--- FIM DO PREVIEW ---")
+        
+        if len(texto) < 200:
+            print("⚠️  ALERTA: O texto extraído é muito curto. Pode ser que o site não tenha carregado corretamente.")
+
+# --- Modo em massa (diagnóstico da base inteira) ---
+
+def carregar_urls(caminho):
+    """Lê URLs de um CSV (coluna Website) ou de um .txt com uma URL por linha."""
+    if caminho.lower().endswith('.csv'):
+        with open(caminho, newline='', encoding='utf-8') as f:
+            leitor = csv.DictReader(f)
+            coluna = next((c for c in leitor.fieldnames if c.strip().lower() == 'website'), None)
+            if coluna is None:
+                print(f"❌ Coluna 'Website' não encontrada em {caminho}")
+                return []
+            urls = [(linha.get(coluna) or '').strip() for linha in leitor]
+    else:
+        with open(caminho, encoding='utf-8') as f:
+            urls = [linha.strip() for linha in f if linha.strip() and not linha.startswith('#')]
+
+    # Remove inválidas e duplicadas mantendo a ordem
+    vistos = set()
+    return [u for u in urls if u.startswith('http') and not (u in vistos or vistos.add(u))]
+
+def parece_js(home):
+    """Heurística: HTML grande/cheio de <script> mas quase nenhum texto extraído."""
+    if home['status'] is None or home['erro']:
+        return False
+    if home['chars'] < 500 and home['scripts'] >= 5:
+        return True
+    return home['bytes'] > 20000 and home['chars'] * 50 < home['bytes']
+
+def diagnosticar_url(url):
+    """Roda o scraper numa URL coletando as métricas de cada requisição."""
+    stats = []
+    t0 = time.perf_counter()
+    try:
+        texto = scrape_website(url, stats=stats)
+    except Exception as e:
+        texto = None
+        stats.append({'url': url, 'status': None, 'bytes': 0, 't_fetch': 0.0, 't_parse': 0.0,
+                      'chars': 0, 'scripts': 0, 'erro': f'excecao: {e}', 'aproveitada': False})
+    home = stats[0] if stats else {'status': None, 'bytes': 0, 'chars': 0, 'scripts': 0, 'erro': 'sem_requisicao'}
+    return {
+        'url': url,
+        'status': home['status'],
+        'erro': home['erro'],
+        'bytes': sum(m['bytes'] for m in stats),
+        'chars': len(texto) if texto else 0,
+        # Sub-páginas seguidas de fato (com conteúdo aproveitado), não todas as tentativas
+        'subpaginas': sum(1 for m in stats[1:] if m['aproveitada']),
+        't_fetch': sum(m['t_fetch'] for m in stats),
+        't_parse': sum(m['t_parse'] for m in stats),
+        't_total': time.perf_counter() - t0,
+        'js': parece_js(home),
+    }
+
+def imprimir_relatorio(resultados):
+    print(f"\n{'Status':>6} {'KB':>7} {'Chars':>7} {'Sub':>3} {'Fetch':>6} {'Parse':>6}  URL")
+    for r in sorted(resultados, key=lambda r: r['t_total'], reverse=True):
+        status = r['status'] if r['status'] is not None else '-'
+        avisos = []
+        if r['erro']:
+            avisos.append(f"❌ {r['erro']}")
+        elif r['chars'] < 200:
+            avisos.append("⚠️ pouco texto")
+        if r['js']:
+            avisos.append("⚠️ provável JS-rendered")
+        print(f"{status:>6} {r['bytes'] / 1024:>7.1f} {r['chars']:>7} {r['subpaginas']:>3} "
+              f"{r['t_fetch']:>5.2f}s {r['t_parse']:>5.2f}s  {r['url']} {' '.join(avisos)}")
+
+    ok = [r for r in resultados if not r['erro']]
+    print("\n--- RESUMO ---")
+    print(f"URLs: {len(resultados)} | OK: {len(ok)} | Falhas: {len(resultados) - len(ok)} | "
+          f"Prováveis JS-rendered: {sum(r['js'] for r in resultados)}")
+    print(f"Tempo somado: fetch {sum(r['t_fetch'] for r in resultados):.1f}s | "
+          f"parse {sum(r['t_parse'] for r in resultados):.1f}s | "
+          f"{sum(r['bytes'] for r in resultados) / 1024 / 1024:.1f} MB baixados")
+
+def salvar_relatorio_csv(resultados, caminho):
+    with open(caminho, 'w', newline='', encoding='utf-8') as f:
+        escritor = csv.DictWriter(f, fieldnames=list(resultados[0].keys()))
+        escritor.writeheader()
+        escritor.writerows(resultados)
+    print(f"💾 Relatório salvo em {caminho}")
+
+def perfilar_mais_lentas(resultados, n):
+    """Reexecuta as N URLs mais lentas sob cProfile (sequencialmente) e salva os .prof."""
+    import cProfile
+    import pstats
+
+    os.makedirs(PROFILES_PATH, exist_ok=True)
+    lentas = sorted(resultados, key=lambda r: r['t_total'], reverse=True)[:n]
+    print(f"\n🔬 Perfilando as {len(lentas)} páginas mais lentas...")
+    for i, r in enumerate(lentas, 1):
+        profiler = cProfile.Profile()
+        profiler.enable()
+        scrape_website(r['url'])
+        profiler.disable()
+        nome = re.sub(r'[^A-Za-z0-9._-]+', '_', r['url'].split('//')[-1])[:60]
+        destino = os.path.join(PROFILES_PATH, f"{i:02d}_{nome}.prof")
+        profiler.dump_stats(destino)
+        print(f"\n[{i}] {r['url']} -> {destino}")
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(8)
+
+def diagnostico_em_massa(caminho=None, workers=8, limite=None, profile=0, memoria=False, saida=None):
+    caminho = caminho or MASTER_CSV
+    urls = carregar_urls(caminho)
+    if limite:
+        urls = urls[:limite]
+    if not urls:
+        print("Nenhuma URL válida encontrada.")
+        return
+
+    print(f"🕵️  Diagnóstico em massa: {len(urls)} URLs de {caminho} ({workers} em paralelo)")
+
+    if memoria:
+        import tracemalloc
+        tracemalloc.start()
+
+    t0 = time.perf_counter()
+    resultados = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futuros = [executor.submit(diagnosticar_url, u) for u in urls]
+        for count, futuro in enumerate(as_completed(futuros), 1):
+            resultados.append(futuro.result())
+            print(f"[{count}/{len(urls)}] concluídas...", end='\r')
+    print(f"\n⏱️  Tempo de parede: {time.perf_counter() - t0:.1f}s")
+
+    imprimir_relatorio(resultados)
+
+    if memoria:
+        snapshot = tracemalloc.take_snapshot()
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"\n🧠 Pico de memória alocada: {pico / 1024 / 1024:.1f} MB. Maiores alocações:")
+        for stat in snapshot.statistics('lineno')[:10]:
+            print(f"   {stat}")
+
+    if saida:
+        salvar_relatorio_csv(resultados, saida)
+
+    if profile:
+        perfilar_mais_lentas(resultados, profile)
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Teste de visão do scraper (uma URL ou a base inteira).')
+    parser.add_argument('url', nargs='?', help='URL do site do professor (pede via input se omitida).')
+    parser.add_argument('--bulk', nargs='?', const=MASTER_CSV, default=None, metavar='ARQUIVO',
+                        help='Diagnostica todas as URLs de um CSV (coluna Website) ou .txt. Padrão: base mestra.')
+    parser.add_argument('--workers', type=int, default=8, help='Requisições em paralelo no modo em massa.')
+    parser.add_argument('--limite', type=int, default=None, help='Diagnostica só as N primeiras URLs.')
+    parser.add_argument('--profile', type=int, default=0, metavar='N',
+                        help='Salva perfis cProfile das N páginas mais lentas em data/profiles/.')
+    parser.add_argument('--tracemalloc', action='store_true', help='Mede o pico e os maiores pontos de alocação de memória.')
+    parser.add_argument('--saida', default=None, metavar='CSV', help='Salva o relatório por URL em CSV.')
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.bulk:
+        diagnostico_em_massa(args.bulk, args.workers, args.limite, args.profile, args.tracemalloc, args.saida)
+    else:
+        teste_real(args.url)
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,11 @@
 import pandas as pd
 import glob
 import os
+from summerjob.config import DATA_PATH
 
 def clean_manual_fits():
     # Caminho para a pasta data
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    data_path = os.path.join(base_path, '..', 'data')
+    data_path = DATA_PATH
     
     # Pega apenas os arquivos de dados brutos, não o consolidado
     csv_files = glob.glob(os.path.join(data_path, 'professores_data*.csv'))
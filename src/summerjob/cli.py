@@ -0,0 +1,178 @@
+"""
+Ponto de entrada único do projeto: `summerjob <subcomando>`.
+
+Os módulos pesados (pandas, google.generativeai, streamlit, bs4) só são importados
+dentro do subcomando que precisa deles, então operações rápidas como `summerjob --help`
+ou `summerjob models` não pagam o custo de carregar o resto.
+Use `--tempos` para ver quanto cada etapa levou para iniciar.
+"""
+import argparse
+import importlib
+import sys
+import time
+
+_INICIO = time.perf_counter()
+
+_tempos_import = []
+
+def importar(nome_modulo):
+    """Importa um módulo do pacote sob demanda, registrando o tempo gasto no import."""
+    t0 = time.perf_counter()
+    modulo = importlib.import_module(f'summerjob.{nome_modulo}')
+    _tempos_import.append((nome_modulo, time.perf_counter() - t0))
+    return modulo
+
+def cmd_ingest(args):
+    importar('migrate_to_master').migrate_to_master()
+
+def cmd_clean(args):
+    importar('clean_data').clean_manual_fits()
+
+def cmd_scrape(args):
+    check_scraper = importar('check_scraper')
+    if args.bulk is not None:
+        check_scraper.diagnostico_em_massa(args.bulk or None, args.workers, args.limite,
+                                           args.profile, args.tracemalloc, args.saida)
+    else:
+        check_scraper.teste_real(args.url)
+
+def cmd_analyze(args):
+    importar('main').carregar_e_processar_dados(ignorar_backoff=args.ignorar_backoff,
+                                                perfil=args.perfil, rescrape=args.rescrape)
+
+def cmd_reset(args):
+    importar('reset_master').reset_and_clean_master(args.perfil)
+
+def cmd_models(args):
+    importar('check_models').listar_modelos()
+
+def cmd_snapshot(args):
+    config = importar('config')
+    snapshot = importar('snapshot')
+    meta = snapshot.gerar_snapshot(perfil=args.perfil)
+    if meta is None:
+        print("❌ Base mestra não encontrada.")
+        return 1
+    print(f"✅ Snapshot gerado: {len(meta)} professores em {config.snapshot_parquet(args.perfil)}")
+
+def cmd_agregados(args):
+    base_mestra = importar('base_mestra')
+    agregados = importar('agregados')
+    df = base_mestra.carregar_base(args.perfil)
+    if df is None:
+        print("❌ Base mestra não encontrada.")
+        return 1
+    if args.reconstruir:
+        agregados.reconstruir(df, args.perfil, base_mestra.mtime_base(args.perfil))
+        print("✅ Agregados reconstruídos a partir da base mestra.")
+    elif base_mestra.garantir_agregados(df, args.perfil):
+        print("✅ Agregados reconstruídos: a base mudou desde a última atualização.")
+    tabela = agregados.resumo(args.dimensao, perfil=args.perfil)
+    print(tabela.to_string() if not tabela.empty else "Sem dados agregados.")
+
+def cmd_perfis(args):
+    perfis = importar('perfis')
+    snapshot = importar('snapshot')
+    agregados = importar('agregados')
+    for nome in perfis.listar_perfis():
+        # Resultados alterados por fora (reset, edição manual): atualiza antes de contar
+        if snapshot.snapshot_desatualizado(nome):
+            snapshot.gerar_snapshot(perfil=nome)
+        analisados, total = agregados.cobertura(nome)
+        print(f"👤 {nome}: {analisados}/{total} analisados")
+
+def cmd_serve(args):
+    import subprocess
+    config = importar('config')
+    comando = [sys.executable, '-m', 'streamlit', 'run', config.DASHBOARD_PY,
+               f'--server.port={args.port}']
+    if args.address:
+        comando.append(f'--server.address={args.address}')
+    return subprocess.call(comando)
+
+def _arg_perfil(parser):
+    from summerjob.config import PERFIL_PADRAO # só os, não pesa no startup
+    parser.add_argument('--perfil', default=PERFIL_PADRAO,
+                        help=f'Perfil do candidato (arquivo data/perfis/<perfil>.md). Padrão: {PERFIL_PADRAO}.')
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='summerjob',
+        description='Summer Job Matcher: ingestão, scraping, análise LLM e dashboard.'
+    )
+    parser.add_argument('--tempos', action='store_true',
+                        help='Mostra o tempo de inicialização e de import de cada módulo.')
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p = sub.add_parser('ingest', help='Unifica os CSVs antigos (professores_data*.csv) na base mestra.')
+    p.set_defaults(func=cmd_ingest)
+
+    p = sub.add_parser('clean', help='Remove classificações manuais antigas (High/Low) dos CSVs brutos.')
+    p.set_defaults(func=cmd_clean)
+
+    p = sub.add_parser('scrape', help='Testa o scraper em uma URL (ou na base inteira com --bulk).')
+    p.add_argument('url', nargs='?', help='URL do site do professor (pede via input se omitida).')
+    p.add_argument('--bulk', nargs='?', const='', default=None, metavar='ARQUIVO',
+                   help='Diagnostica todas as URLs de um CSV (coluna Website) ou .txt. Padrão: base mestra.')
+    p.add_argument('--workers', type=int, default=8, help='Requisições em paralelo no modo em massa.')
+    p.add_argument('--limite', type=int, default=None, help='Diagnostica só as N primeiras URLs.')
+    p.add_argument('--profile', type=int, default=0, metavar='N',
+                   help='Salva perfis cProfile das N páginas mais lentas em data/profiles/.')
+    p.add_argument('--tracemalloc', action='store_true', help='Mede o pico e os maiores pontos de alocação de memória.')
+    p.add_argument('--saida', default=None, metavar='CSV', help='Salva o relatório por URL em CSV.')
+    p.set_defaults(func=cmd_scrape)
+
+    p = sub.add_parser('analyze', help='Faz scraping + análise LLM dos professores pendentes.')
+    p.add_argument('--ignorar-backoff', action='store_true',
+                   help='Tenta de novo sites com erro mesmo antes do fim do backoff.')
+    p.add_argument('--rescrape', action='store_true',
+                   help='Baixa os sites de novo em vez de usar o conteúdo em cache.')
+    _arg_perfil(p)
+    p.set_defaults(func=cmd_analyze)
+
+    p = sub.add_parser('reset', help='Limpa os resultados (Fit, relatório, score, modelo, tokens) de um perfil, com backup.')
+    _arg_perfil(p)
+    p.set_defaults(func=cmd_reset)
+
+    p = sub.add_parser('models', help='Lista os modelos Gemini disponíveis para a API Key.')
+    p.set_defaults(func=cmd_models)
+
+    p = sub.add_parser('snapshot', help='Gera o snapshot Parquet + relatórios usado pelo dashboard.')
+    _arg_perfil(p)
+    p.set_defaults(func=cmd_snapshot)
+
+    p = sub.add_parser('agregados', help='Mostra a distribuição de fit por universidade/área/modelo.')
+    from summerjob.config import DIMENSOES_AGREGADOS # só os, não pesa no startup
+    p.add_argument('dimensao', nargs='?', default='universidade', choices=DIMENSOES_AGREGADOS)
+    p.add_argument('--reconstruir', action='store_true', help='Recalcula os agregados a partir da base mestra.')
+    _arg_perfil(p)
+    p.set_defaults(func=cmd_agregados)
+
+    p = sub.add_parser('perfis', help='Lista os perfis de candidato (data/perfis/*.md) e quanto já foi analisado.')
+    p.set_defaults(func=cmd_perfis)
+
+    p = sub.add_parser('serve', help='Sobe o dashboard Streamlit.')
+    p.add_argument('--port', type=int, default=8501)
+    p.add_argument('--address', default=None)
+    p.set_defaults(func=cmd_serve)
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.tempos:
+        print(f"⏱️  CLI pronta em {(time.perf_counter() - _INICIO) * 1000:.0f} ms")
+
+    t0 = time.perf_counter()
+    resultado = args.func(args)
+
+    if args.tempos:
+        for nome, segundos in _tempos_import:
+            print(f"⏱️  import {nome}: {segundos * 1000:.0f} ms")
+        print(f"⏱️  {args.comando}: {time.perf_counter() - t0:.2f} s no total")
+
+    return resultado if isinstance(resultado, int) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
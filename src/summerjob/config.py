@@ -0,0 +1,55 @@
+import os
+
+# Caminhos compartilhados pelos scripts do projeto (evita que cada um monte os seus)
+PACOTE_PATH = os.path.dirname(os.path.abspath(__file__))
+# Raiz com data/ (e o .env). Rodando do checkout (ou instalado com `uv sync`/`pip install -e`)
+# é a pasta acima do src/ (src/summerjob/ -> raiz). Num wheel normal o código fica no
+# site-packages, então a raiz vem de SUMMERJOB_HOME ou, na falta dela, do diretório atual.
+_ROOT_CHECKOUT = os.path.dirname(os.path.dirname(PACOTE_PATH))
+if os.getenv('SUMMERJOB_HOME'):
+    ROOT_PATH = os.path.abspath(os.environ['SUMMERJOB_HOME'])
+elif os.path.exists(os.path.join(_ROOT_CHECKOUT, 'pyproject.toml')):
+    ROOT_PATH = _ROOT_CHECKOUT
+else:
+    ROOT_PATH = os.getcwd()
+DATA_PATH = os.path.join(ROOT_PATH, 'data')
+ENV_FILE = os.path.join(ROOT_PATH, '.env')
+MASTER_CSV = os.path.join(DATA_PATH, 'base_professores.csv')
+DASHBOARD_PY = os.path.join(PACOTE_PATH, 'dashboard.py')
+
+# Perfis de candidato (um arquivo .md por perfil). Cada perfil, inclusive o padrão, grava
+# os resultados em data/resultados/<perfil>.csv; a base mestra fica só com os professores
+PERFIS_PATH = os.path.join(DATA_PATH, 'perfis')
+PERFIL_PADRAO = 'padrao'
+RESULTADOS_PATH = os.path.join(DATA_PATH, 'resultados')
+
+# Cache do conteúdo raspado dos sites (um scraping por professor, reaproveitado por todos os perfis)
+CACHE_PATH = os.path.join(DATA_PATH, 'cache')
+CONTEUDO_DB = os.path.join(CACHE_PATH, 'conteudo_sites.sqlite')
+
+# Snapshot colunar para o dashboard (metadados em Parquet + relatórios por chave), por perfil
+SNAPSHOT_PATH = os.path.join(DATA_PATH, 'snapshot')
+
+# Dimensões dos agregados de fit (ver agregados.py); 'geral' é o total da base
+DIMENSOES_AGREGADOS = ['geral', 'universidade', 'area', 'modelo']
+
+def perfil_md(perfil):
+    return os.path.join(PERFIS_PATH, f'{perfil}.md')
+
+def resultados_csv(perfil=PERFIL_PADRAO):
+    return os.path.join(RESULTADOS_PATH, f'{perfil}.csv')
+
+def snapshot_path(perfil=PERFIL_PADRAO):
+    return os.path.join(SNAPSHOT_PATH, perfil)
+
+def snapshot_parquet(perfil=PERFIL_PADRAO):
+    return os.path.join(snapshot_path(perfil), 'professores.parquet')
+
+def relatorios_db(perfil=PERFIL_PADRAO):
+    return os.path.join(snapshot_path(perfil), 'relatorios.sqlite')
+
+def agregados_db(perfil=PERFIL_PADRAO):
+    return os.path.join(snapshot_path(perfil), 'agregados.sqlite')
+
+# Registro de falhas de scraping (backoff por linha e por host)
+FALHAS_JSON = os.path.join(DATA_PATH, 'falhas_scraping.json')
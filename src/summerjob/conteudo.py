@@ -0,0 +1,35 @@
+"""
+Cache do conteúdo raspado dos sites dos professores.
+
+Cada site é raspado uma vez e o texto fica guardado pela chave do professor, então
+avaliar um novo perfil de candidato (ou reanalisar após um reset) custa só chamadas
+ao LLM, sem crawling. Use `summerjob analyze --rescrape` para baixar de novo.
+"""
+import os
+import sqlite3
+from datetime import datetime
+
+from summerjob.config import CACHE_PATH, CONTEUDO_DB
+
+def _conectar():
+    os.makedirs(CACHE_PATH, exist_ok=True)
+    conn = sqlite3.connect(CONTEUDO_DB)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS conteudo (
+            chave TEXT PRIMARY KEY, website TEXT, texto TEXT, raspado_em TEXT
+        )""")
+    return conn
+
+def ler_conteudo(chave):
+    """Texto raspado do site do professor, ou None se ainda não está no cache."""
+    if not os.path.exists(CONTEUDO_DB):
+        return None
+    with _conectar() as conn:
+        linha = conn.execute("SELECT texto FROM conteudo WHERE chave = ?", (chave,)).fetchone()
+    return linha[0] if linha else None
+
+def salvar_conteudo(chave, website, texto):
+    with _conectar() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO conteudo (chave, website, texto, raspado_em) VALUES (?, ?, ?, ?)",
+            (chave, str(website), texto, datetime.now().isoformat(timespec='seconds')))
@@ -0,0 +1,306 @@
+import streamlit as st
+import pandas as pd
+import os
+import sys
+
+# `streamlit run` executa este arquivo como script, fora do pacote: rodando direto do
+# checkout (sem o projeto instalado), o src/ precisa estar no path para `summerjob` importar
+if __package__ in (None, ''):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from summerjob.config import MASTER_CSV, PERFIL_PADRAO, snapshot_parquet
+from summerjob.snapshot import snapshot_desatualizado, gerar_snapshot, ler_metadados, ler_relatorio
+from summerjob.jobs import FilaAnalise
+from summerjob.perfis import listar_perfis
+from summerjob import agregados
+# Configuração da Página
+st.set_page_config(
+    page_title="Summer Job Matcher",
+    page_icon="🎓",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Estilo CSS Personalizado
+st.markdown("""
+<style>
+    .reportview-container {
+        background: #f0f2f6;
+    }
+    .big-font {
+        font-size:30px !important;
+        font-weight: bold;
+    }
+    .stDataFrame {
+        border-radius: 10px;
+        overflow: hidden;
+    }
+    div[data-testid="stMetricValue"] {
+        font-size: 2rem;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+@st.cache_resource
+def get_fila(perfil):
+    # Um pool de workers por perfil e por processo do Streamlit, fora da thread do script
+    return FilaAnalise(perfil)
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def ler_snapshot(perfil, versao):
+    # `versao` é o mtime do Parquet: só relê quando o snapshot é regerado.
+    # Guarda alguns perfis para a troca entre eles no sidebar ser instantânea
+    return ler_metadados(perfil)
+
+def load_data(perfil):
+    # Caminho do arquivo MESTRE
+    data_path = MASTER_CSV
+    
+    if not os.path.exists(data_path):
+        st.error(f"Arquivo não encontrado: {data_path}")
+        return None
+    
+    fila = get_fila(perfil)
+
+    # Enquanto a fila roda a base mestra muda a cada resultado; em vez de regerar o
+    # snapshot a cada rerun, só sobrepomos os resultados que já ficaram prontos
+    if snapshot_desatualizado(perfil) and not fila.em_andamento():
+        if gerar_snapshot(perfil=perfil) is None:
+            return None
+
+    # Lê só os metadados do snapshot Parquet (os relatórios ficam fora, lidos sob demanda)
+    df = ler_snapshot(perfil, os.path.getmtime(snapshot_parquet(perfil)))
+    return fila.aplicar_resultados(df)
+
+FITS_ALTOS = ['Fit Muito Alto', 'Fit Alto']
+
+def metricas(df_filtered, selected_fits, selected_area, selected_unis, perfil=PERFIL_PADRAO):
+    """Total e quantidade de alto fit, lidos dos agregados quando os filtros permitem.
+
+    Fit e Universidade particionam a base, então dá para somar os agregados; o filtro
+    de Área não (um professor tem várias tags), aí cai na contagem do DataFrame filtrado.
+    """
+    if selected_area or not agregados.existem(perfil):
+        return len(df_filtered), int(df_filtered['Fit'].isin(FITS_ALTOS).sum())
+
+    fits = [f if isinstance(f, str) else agregados.SEM_FIT for f in selected_fits]
+    dados = agregados.ler('universidade' if selected_unis else 'geral', perfil)
+    dados = dados[dados['fit'].isin(fits)]
+    if selected_unis:
+        dados = dados[dados['valor'].isin(selected_unis)]
+    return int(dados['n'].sum()), int(dados.loc[dados['fit'].isin(FITS_ALTOS), 'n'].sum())
+
+def painel_agregados(df, selected_fits, perfil=PERFIL_PADRAO):
+    st.subheader("📊 Distribuição de Fit")
+    fits = [f if isinstance(f, str) else agregados.SEM_FIT for f in selected_fits]
+
+    abas = st.tabs(["Universidade", "Área", "Modelo"])
+    for aba, dimensao in zip(abas, ['universidade', 'area', 'modelo']):
+        with aba:
+            tabela = agregados.resumo(dimensao, fits, perfil)
+            if tabela.empty:
+                st.info("Sem dados agregados para os filtros selecionados.")
+                continue
+
+            colunas_fit = [c for c in tabela.columns if c not in ('Total', 'Score Médio')]
+            # Área tem muitas tags: mostra só as mais frequentes no gráfico
+            st.bar_chart(tabela[colunas_fit].head(15))
+            st.dataframe(tabela, use_container_width=True)
+
+            # Drill-down: um valor da dimensão -> números do agregado + professores do grupo
+            valor = st.selectbox("Detalhar", options=tabela.index.tolist(), key=f"drill_{dimensao}")
+            if valor:
+                linha = tabela.loc[valor]
+                c1, c2, c3 = st.columns(3)
+                c1.metric("Professores", int(linha['Total']))
+                c2.metric("Alto Fit", int(sum(linha.get(f, 0) for f in FITS_ALTOS)))
+                c3.metric("Score Médio", "-" if pd.isna(linha['Score Médio']) else f"{linha['Score Médio']:.1f}")
+
+                if dimensao == 'area':
+                    grupo = df[df['Area'].apply(lambda a: valor in agregados.normalizar_areas(a))]
+                else:
+                    coluna = 'Universidade' if dimensao == 'universidade' else 'Modelo'
+                    grupo = df[df[coluna].astype('string').str.strip().fillna('N/A') == valor]
+                st.dataframe(grupo[['Professor', 'Universidade', 'Fit', 'Score']],
+                             hide_index=True, use_container_width=True)
+
+def precisa_analisar(fit):
+    return str(fit).strip().lower() in ['nan', 'none', '', '<na>', 'erro']
+
+@st.fragment(run_every=2)
+def progresso_fila(perfil):
+    fila = get_fila(perfil)
+    prog = fila.progresso()
+
+    if prog['total']:
+        st.progress(prog['processados'] / prog['total'],
+                    text=f"{prog['processados']}/{prog['total']} processados")
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric("Na fila", prog['na_fila'])
+        c2.metric("Analisando", prog['analisando'])
+        c3.metric("Com erro", prog['erros'])
+        c4.metric("Throughput", f"{prog['por_minuto']:.1f}/min")
+        if prog['cota_excedida']:
+            st.error("✋ Cota do Gemini excedida: o restante da fila foi cancelado.")
+
+    # Chegou resultado novo: roda o app de novo para mesclar na tabela (dados vêm do cache)
+    if st.session_state.get('versao_fila') != fila.versao:
+        st.session_state['versao_fila'] = fila.versao
+        st.rerun(scope="app")
+
+def painel_analise(df_filtered, perfil):
+    fila = get_fila(perfil)
+
+    with st.expander("⚙️ Análise em segundo plano", expanded=fila.em_andamento()):
+        modo = st.radio("O que analisar", ["Professores filtrados", "Selecionar professores"], horizontal=True)
+        if modo == "Selecionar professores":
+            nomes = st.multiselect("Professores", options=df_filtered['Professor'].dropna().unique())
+            alvo = df_filtered[df_filtered['Professor'].isin(nomes)]
+        else:
+            alvo = df_filtered
+
+        somente_pendentes = st.checkbox("Somente pendentes (sem Fit ou com Erro)", value=True)
+        if somente_pendentes:
+            alvo = alvo[alvo['Fit'].apply(precisa_analisar)]
+        alvo = alvo[alvo['Website'].fillna('').str.contains('http')]
+        ignorar_backoff = st.checkbox("Ignorar backoff", value=False,
+                                      help="Tenta de novo sites que falharam recentemente (como --ignorar-backoff no CLI).")
+
+        b1, b2 = st.columns(2)
+        if b1.button(f"▶️ Enfileirar {len(alvo)} professores", disabled=alvo.empty):
+            linhas = alvo[['Chave', 'Website', 'Professor']].to_dict('records')
+            try:
+                novos = fila.enfileirar(linhas, ignorar_backoff=ignorar_backoff)
+                st.toast(f"{novos} professores enfileirados para análise.")
+            except FileNotFoundError as e:
+                st.error(f"❌ {e}")
+        if b2.button("⏹️ Cancelar fila", disabled=not fila.em_andamento()):
+            fila.cancelar()
+
+        progresso_fila(perfil)
+
+def main():
+    st.title("🎓 Professor Research Fit Explorer")
+    st.markdown("Análise de compatibilidade para vagas de Summer/Winter Job baseada em **Interesses de Pesquisa** e **Perfil do Candidato**.")
+
+    # Perfil do candidato: cada um tem seus próprios resultados, sobre os mesmos professores
+    perfil = st.sidebar.selectbox("Perfil do Candidato", options=listar_perfis(),
+                                  help="Arquivos .md em data/perfis/. Novos perfis reaproveitam o conteúdo já raspado dos sites.")
+
+    df = load_data(perfil)
+
+    if df is None:
+        st.warning("⚠️ Arquivo de dados não encontrado. Execute `summerjob analyze` primeiro para gerar as análises.")
+        return
+
+    # Sidebar - Filtros
+    st.sidebar.header("Filtros")
+    
+    # Filtro de Fit
+    opcoes_fit = df['Fit'].unique().tolist()
+    # Tenta ordenar opções de forma lógica
+    ordem_logica = ["Fit Muito Alto", "Fit Alto", "Fit Baixo", "Fit Muito Baixo", "Erro", "N/A"]
+    opcoes_fit_sorted = [x for x in ordem_logica if x in opcoes_fit] + [x for x in opcoes_fit if x not in ordem_logica]
+    
+    selected_fits = st.sidebar.multiselect("Filtrar por Nível de Fit", options=opcoes_fit_sorted, default=opcoes_fit_sorted)
+    
+    # Filtro de Área
+    if 'Area' in df.columns:
+        all_areas = set()
+        for x in df['Area'].dropna():
+            all_areas.update([a.strip() for a in str(x).split(',')])
+        selected_area = st.sidebar.multiselect("Filtrar por Área de Interesse", options=sorted(list(all_areas)))
+    else:
+        selected_area = []
+
+    # Filtro de Universidade
+    if 'Universidade' in df.columns:
+        all_unis = sorted(list({str(x).strip() for x in df['Universidade'].dropna()}))
+        selected_unis = st.sidebar.multiselect("Filtrar por Universidade", options=all_unis)
+    else:
+        selected_unis = []
+
+    # Aplicação dos Filtros
+    df_filtered = df[df['Fit'].isin(selected_fits)]
+    
+    if selected_area:
+        # Filtra se a area do professor contem qualquer uma das selecionadas
+        mask = df_filtered['Area'].apply(lambda x: any(area in str(x) for area in selected_area))
+        df_filtered = df_filtered[mask]
+
+    if selected_unis:
+         df_filtered = df_filtered[df_filtered['Universidade'].isin(selected_unis)]
+
+    # Métricas (dos agregados materializados sempre que possível)
+    total_count, high_fit_count = metricas(df_filtered, selected_fits, selected_area, selected_unis, perfil)
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Total de Professores (Filtrado)", total_count)
+    col2.metric("Oportunidades de Alto Fit", high_fit_count)
+    
+    # Quanto da base já foi analisada para este perfil
+    analisados, total = agregados.cobertura(perfil)
+    processed_percent = round(100 * analisados / total) if total else 0
+    col3.metric("Análise Completada", f"{processed_percent}%")
+
+    painel_analise(df_filtered, perfil)
+
+    st.markdown("---")
+
+    painel_agregados(df, selected_fits, perfil)
+
+    st.markdown("---")
+
+    # Exibição Principal (Tabela Interativa)
+    if not df_filtered.empty:
+        # Configurar link clicável na tabela é chatinho no st.dataframe padrão, 
+        # mas vamos usar st.data_editor com column_config para ficar TOP
+        
+        st.subheader("📋 Lista de Professores")
+        
+        column_config = {
+            "Website": st.column_config.LinkColumn("Website"),
+            "Fit": st.column_config.TextColumn("Nível de Fit", width="medium"),
+            "Score": st.column_config.NumberColumn("Score", format="%d%%"),
+            "Professor": st.column_config.TextColumn("Professor", width="medium"),
+            "Universidade": st.column_config.TextColumn("Universidade", width="medium"),
+            "Area": st.column_config.TextColumn("Área de Pesquisa", width="medium"),
+        }
+        
+        # Reordenar colunas para ficar visualmente agradável
+        # (o relatório LLM não vai para a tabela: é lido sob demanda nos detalhes abaixo)
+        cols_order = ['Professor', 'Universidade', 'Fit', 'Score', 'Area', 'Website']
+        # Garante que só usa colunas que existem
+        cols_order = [c for c in cols_order if c in df_filtered.columns]
+        
+        st.dataframe(
+            df_filtered[cols_order],
+            column_config=column_config,
+            hide_index=True,
+            use_container_width=True
+        )
+        
+        # Detalhes Expandidos (Opcional, para ler a justificativa completa com calma)
+        st.markdown("### 🔍 Detalhes da Análise")
+        prof_selecionado = st.selectbox("Selecione um professor para ver o relatório completo:", df_filtered['Professor'].unique())
+        
+        if prof_selecionado:
+            row = df_filtered[df_filtered['Professor'] == prof_selecionado].iloc[0]
+            
+            with st.expander(f"Ver Análise Completa de **{prof_selecionado}**", expanded=True):
+                c1, c2 = st.columns([1, 2])
+                with c1:
+                    st.info(f"**Fit:** {row['Fit']}")
+                    st.write(f"**Área:** {row['Area']}")
+                    st.write(f"**Link:** [Acessar Página]({row['Website']})")
+                    if isinstance(row.get('Modelo'), str):
+                        st.caption(f"Modelo: {row['Modelo']} · Tokens: {row['Tokens_Prompt']} prompt / {row['Tokens_Resposta']} resposta")
+                with c2:
+                    st.markdown("#### Relatório da IA")
+                    relatorio = ler_relatorio(row['Chave'], perfil)
+                    st.write(relatorio if relatorio else "Sem relatório para este professor.")
+                    
+    else:
+        st.info("Nenhum professor encontrado com os filtros selecionados.")
+
+if __name__ == "__main__":
+    main()
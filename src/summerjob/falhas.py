@@ -0,0 +1,201 @@
+"""
+Registro persistente de falhas de scraping (negative cache) com backoff exponencial.
+
+- Por linha (Website): tipo do último erro, número de tentativas e quando pode tentar de novo.
+- Por host: mesma coisa, mas só para erros que indicam o servidor inteiro fora/bloqueando
+  (timeout, conexão, 403/429) na página principal do professor. Um 404 de um professor,
+  ou uma sub-página lenta, não bloqueia o resto do departamento.
+- Dentro de uma execução, hosts que estouram o timeout repetidamente são pulados de vez
+  (inclusive nos sub-links), para não gastar 10s por requisição.
+
+Mais de um processo pode usar o mesmo arquivo (`summerjob analyze` e o dashboard): ao
+salvar, as entradas alteradas aqui são mescladas com o que está em disco, em vez de
+sobrescrever o registro dos outros.
+"""
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+
+from summerjob.config import FALHAS_JSON
+
+# Erros que indicam problema no host como um todo
+ERROS_DE_HOST = {'timeout', 'conexao', 'bloqueio'}
+
+BACKOFF_BASE = timedelta(hours=6)
+BACKOFF_MAX = timedelta(days=14)
+
+# Falhas seguidas de um host antes de ele entrar em backoff (e, para timeouts na mesma
+# execução, antes de ser pulado até o fim do run). Uma falha isolada não bloqueia o host.
+MAX_FALHAS_HOST = 2
+
+def host_de(url):
+    return urlparse(str(url)).netloc.lower()
+
+def classificar_erro(exc):
+    """Converte uma exceção do requests num tipo de erro curto."""
+    import requests
+
+    if isinstance(exc, requests.exceptions.Timeout):
+        return 'timeout'
+    if isinstance(exc, requests.exceptions.ConnectionError):
+        return 'conexao'
+    if isinstance(exc, requests.exceptions.HTTPError) and exc.response is not None:
+        status = exc.response.status_code
+        if status in (403, 429):
+            return 'bloqueio'
+        return f'http_{status}'
+    return 'erro'
+
+def calcular_backoff(tentativas):
+    """Espera antes da próxima tentativa: base * 2^(tentativas-1), limitada a BACKOFF_MAX."""
+    return min(BACKOFF_BASE * (2 ** max(tentativas - 1, 0)), BACKOFF_MAX)
+
+@contextmanager
+def _trava_arquivo(caminho):
+    """Lock entre processos (ler + mesclar + gravar o JSON como uma operação só).
+    Sem fcntl (Windows) segue sem lock: a mescla ainda evita perder a maior parte."""
+    try:
+        import fcntl
+    except ImportError:
+        yield
+        return
+    with open(caminho + '.lock', 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+class RegistroFalhas:
+    def __init__(self, caminho=FALHAS_JSON, ignorar_backoff=False):
+        self.caminho = caminho
+        self.linhas = {}
+        self.hosts = {}
+        # O mesmo registro é usado por várias threads (workers da fila do dashboard):
+        # toda alteração e o salvamento passam por este lock
+        self.lock = threading.RLock()
+        # Estado só desta execução
+        self.nova_execucao(ignorar_backoff)
+        # Chaves alteradas (falha ou sucesso) desde o último salvamento, por tabela
+        self._alteradas = {'linhas': set(), 'hosts': set()}
+        self.linhas, self.hosts = self._ler_disco()
+
+    def nova_execucao(self, ignorar_backoff=False):
+        """Zera o estado da execução (hosts pulados, timeouts, último erro). Um registro
+        de vida longa, como o da fila do dashboard, chama isto a cada novo lote."""
+        with self.lock:
+            # Se True, o backoff persistido é ignorado (mas o short-circuit da execução continua valendo)
+            self.ignorar_backoff = ignorar_backoff
+            self.timeouts_run = {}
+            self.hosts_pulados_run = set()
+            self.ultimo_erro = {}
+
+    def _ler_disco(self):
+        if not os.path.exists(self.caminho):
+            return {}, {}
+        try:
+            with open(self.caminho, encoding='utf-8') as f:
+                dados = json.load(f)
+            return dados.get('linhas', {}), dados.get('hosts', {})
+        except Exception as e:
+            logging.warning(f"Não foi possível ler o registro de falhas ({self.caminho}): {e}")
+            return {}, {}
+
+    def salvar(self):
+        """Mescla as alterações desta instância com o arquivo atual e grava de forma atômica."""
+        with self.lock, _trava_arquivo(self.caminho):
+            linhas, hosts = self._ler_disco()
+            for nome, disco in (('linhas', linhas), ('hosts', hosts)):
+                tabela = getattr(self, nome)
+                for chave in self._alteradas[nome]:
+                    if chave in tabela:
+                        disco[chave] = tabela[chave]
+                    else:
+                        disco.pop(chave, None)
+                self._alteradas[nome].clear()
+            # Passa a enxergar também o que os outros processos registraram
+            self.linhas, self.hosts = linhas, hosts
+
+            # Temporário com nome único: dois processos salvando ao mesmo tempo não se atropelam
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.caminho) or '.', suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'linhas': self.linhas, 'hosts': self.hosts}, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.caminho)
+
+    def _registrar(self, nome_tabela, chave, tipo):
+        tabela = getattr(self, nome_tabela)
+        entrada = tabela.get(chave, {'tentativas': 0})
+        entrada['tentativas'] += 1
+        entrada['tipo'] = tipo
+        agora = datetime.now()
+        entrada['ultima_falha'] = agora.isoformat(timespec='seconds')
+        entrada['proxima_tentativa'] = (agora + calcular_backoff(entrada['tentativas'])).isoformat(timespec='seconds')
+        tabela[chave] = entrada
+        self._alteradas[nome_tabela].add(chave)
+        return entrada
+
+    @staticmethod
+    def _elegivel(entrada):
+        if not entrada:
+            return True
+        return datetime.now() >= datetime.fromisoformat(entrada['proxima_tentativa'])
+
+    # --- Nível de host (usado pelo scraper a cada requisição) ---
+
+    def host_disponivel(self, url):
+        """False se o host foi pulado nesta execução ou ainda está em backoff."""
+        host = host_de(url)
+        if host in self.hosts_pulados_run:
+            return False
+        entrada = self.hosts.get(host)
+        if self.ignorar_backoff or not entrada or entrada['tentativas'] < MAX_FALHAS_HOST:
+            return True
+        return self._elegivel(entrada)
+
+    def registrar_falha_requisicao(self, url, tipo, principal=True):
+        """Registra a falha de uma requisição. Só falhas na página principal do professor
+        (`principal=True`) contam para o host: sub-páginas lentas ou quebradas de um
+        professor não podem bloquear o host compartilhado da universidade."""
+        with self.lock:
+            self.ultimo_erro[url] = tipo
+            if tipo not in ERROS_DE_HOST or not principal:
+                return
+            host = host_de(url)
+            self._registrar('hosts', host, tipo)
+            if tipo == 'timeout':
+                self.timeouts_run[host] = self.timeouts_run.get(host, 0) + 1
+                if self.timeouts_run[host] >= MAX_FALHAS_HOST:
+                    logging.warning(f"⛔ Host {host} estourou o timeout {self.timeouts_run[host]}x; pulando até o fim da execução.")
+                    self.hosts_pulados_run.add(host)
+
+    def registrar_sucesso_requisicao(self, url):
+        host = host_de(url)
+        with self.lock:
+            # Marca mesmo sem entrada aqui: o sucesso limpa a do disco, se outro processo gravou
+            self.hosts.pop(host, None)
+            self._alteradas['hosts'].add(host)
+            self.timeouts_run.pop(host, None)
+
+    # --- Nível de linha (usado pelo main.py por professor) ---
+
+    def pode_tentar(self, website):
+        """True se a linha e o host estão fora do período de backoff."""
+        if not self.ignorar_backoff and not self._elegivel(self.linhas.get(str(website))):
+            return False
+        return self.host_disponivel(website)
+
+    def registrar_falha(self, website, tipo=None):
+        with self.lock:
+            if tipo is None:
+                tipo = self.ultimo_erro.get(website, 'sem_conteudo')
+            return dict(self._registrar('linhas', str(website), tipo))
+
+    def registrar_sucesso(self, website):
+        with self.lock:
+            self.linhas.pop(str(website), None)
+            self._alteradas['linhas'].add(str(website))
@@ -0,0 +1,228 @@
+"""
+Fila de análises em segundo plano para o dashboard.
+
+Um pool de threads próprio (fora da thread do script Streamlit) roda scraping + LLM
+para os professores enfileirados. Cada resultado é gravado assim que fica pronto
+(base do perfil + repositório de relatórios) e fica disponível em memória para o
+dashboard sobrepor na tabela, sem recarregar a base inteira. Há uma fila por perfil
+de candidato; o conteúdo raspado dos sites é compartilhado entre elas pelo cache.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from summerjob.analyzer import eh_erro_de_cota
+from summerjob.base_mestra import carregar_base, garantir_agregados, salvar_base
+from summerjob.config import PERFIL_PADRAO
+from summerjob.falhas import RegistroFalhas
+from summerjob.main import analisar_professor, aplicar_resultado, resultado_de_erro, PAUSA_ENTRE_ANALISES
+from summerjob.perfis import carregar_perfil
+from summerjob.snapshot import gerar_snapshot, salvar_relatorio
+
+# Colunas sobrepostas na tabela do dashboard quando um resultado chega
+COLUNAS_RESULTADO = ['Fit', 'Modelo', 'Tokens_Prompt', 'Tokens_Resposta', 'Score']
+
+# Poucos workers: o gargalo é a cota do Gemini, não a CPU
+WORKERS_PADRAO = 2
+
+# Um único registro de falhas por processo, compartilhado pelas filas de todos os perfis
+# (os sites são os mesmos; o lock do registro protege os workers de todas as filas)
+_registro = None
+_registro_lock = threading.Lock()
+
+def registro_compartilhado():
+    global _registro
+    with _registro_lock:
+        if _registro is None:
+            _registro = RegistroFalhas()
+        return _registro
+
+class FilaAnalise:
+    def __init__(self, perfil=PERFIL_PADRAO, workers=WORKERS_PADRAO):
+        self.perfil = perfil
+        self.perfil_candidato = None # lido ao começar cada lote (ver enfileirar)
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='analise')
+        # RLock: em_andamento()/progresso() pegam o lock e também são chamados com ele já tomado
+        self.lock = threading.RLock()
+        self.registro = registro_compartilhado()
+        self.status = {}      # chave -> 'na fila' | 'analisando' | 'ok' | 'erro' | 'pulado' | 'cancelado'
+        self.resultados = {}  # chave -> colunas atualizadas (sem o relatório, que vai para o SQLite)
+        self.versao = 0       # incrementa a cada resultado; o dashboard usa para saber quando redesenhar
+        self.cota_excedida = False
+        self._cancelar = False
+        self._snapshot_pendente = False
+        self._snapshot_lock = threading.Lock()
+        self._inicio_lote = None
+        self._total_lote = 0
+        self._concluidos_lote = 0
+
+    # --- API usada pelo dashboard ---
+
+    def enfileirar(self, linhas, ignorar_backoff=False):
+        """Enfileira professores (dicts com Chave, Website, Professor). Retorna quantos entraram.
+
+        `ignorar_backoff` vale para o lote que começa aqui (como `summerjob analyze --ignorar-backoff`);
+        professores somados a um lote em andamento seguem a opção dele.
+        Levanta FileNotFoundError se o arquivo do perfil não existe.
+        """
+        novos = 0
+        with self.lock:
+            if not self.em_andamento():
+                # O texto do perfil é relido a cada lote: o dashboard abre sem data/perfis/
+                # e edições no .md valem sem reiniciar o processo
+                self.perfil_candidato = carregar_perfil(self.perfil)
+                # Novo lote: zera contadores de progresso, o estado de cancelamento e o estado
+                # de execução do registro (hosts pulados por timeout no lote anterior voltam a valer)
+                self.registro.nova_execucao(ignorar_backoff)
+                self._inicio_lote = time.time()
+                self._total_lote = 0
+                self._concluidos_lote = 0
+                self._cancelar = False
+                self.cota_excedida = False
+            for linha in linhas:
+                chave = linha['Chave']
+                if self.status.get(chave) in ('na fila', 'analisando'):
+                    continue
+                self.status[chave] = 'na fila'
+                self._total_lote += 1
+                novos += 1
+                self.executor.submit(self._processar, dict(linha))
+        return novos
+
+    def cancelar(self):
+        """Descarta o que ainda está na fila (o que já está analisando termina normalmente)."""
+        self._cancelar = True
+
+    def em_andamento(self):
+        with self.lock:
+            return any(s in ('na fila', 'analisando') for s in self.status.values())
+
+    def progresso(self):
+        contagem = {}
+        with self.lock:
+            for s in self.status.values():
+                contagem[s] = contagem.get(s, 0) + 1
+        decorrido = time.time() - self._inicio_lote if self._inicio_lote else 0
+        pendentes = contagem.get('na fila', 0) + contagem.get('analisando', 0)
+        return {
+            'total': self._total_lote,
+            'processados': self._total_lote - pendentes,
+            'concluidos': self._concluidos_lote,
+            'na_fila': contagem.get('na fila', 0),
+            'analisando': contagem.get('analisando', 0),
+            'erros': contagem.get('erro', 0),
+            'por_minuto': self._concluidos_lote / decorrido * 60 if decorrido else 0.0,
+            'decorrido': decorrido,
+            'cota_excedida': self.cota_excedida,
+        }
+
+    def aplicar_resultados(self, df):
+        """Sobrepõe os resultados já concluídos num DataFrame de metadados (por Chave)."""
+        with self.lock:
+            resultados = dict(self.resultados)
+        if not resultados:
+            return df
+
+        df = df.copy()
+        for col in COLUNAS_RESULTADO:
+            if col in df.columns and col not in ('Tokens_Prompt', 'Tokens_Resposta', 'Score'):
+                df[col] = df[col].astype('string') # categóricos não aceitam valores novos
+        posicoes = {chave: i for i, chave in enumerate(df['Chave'])}
+        for chave, colunas in resultados.items():
+            i = posicoes.get(chave)
+            if i is None:
+                continue
+            for col, valor in colunas.items():
+                if col in df.columns:
+                    df.iat[i, df.columns.get_loc(col)] = valor
+        return df
+
+    # --- Workers ---
+
+    def _marcar(self, chave, status):
+        with self.lock:
+            self.status[chave] = status
+
+    def _processar(self, linha):
+        chave = linha['Chave']
+        if self._cancelar or self.cota_excedida:
+            self._marcar(chave, 'cancelado')
+            self._fim_item()
+            return
+
+        self._marcar(chave, 'analisando')
+        try:
+            resultado = analisar_professor(linha['Website'], self.registro, chave=chave,
+                                           perfil_candidato=self.perfil_candidato)
+        except Exception as e:
+            if not eh_erro_de_cota(e):
+                # Erro só desta linha (scraping, cache...): marca e segue com o resto da fila
+                resultado = resultado_de_erro(linha['Website'], e)
+            else:
+                # Cota excedida: para o lote inteiro
+                logging.error(f"✋ Cota excedida na fila de análise: {e}")
+                self.cota_excedida = True
+                self._marcar(chave, 'cancelado')
+                self._fim_item()
+                return
+
+        if resultado is None:
+            self._marcar(chave, 'pulado')
+        else:
+            try:
+                self._gravar(chave, resultado)
+                self._marcar(chave, 'erro' if resultado['Fit'] == 'Erro' else 'ok')
+            except Exception as e:
+                logging.error(f"Erro ao gravar resultado de {linha.get('Professor')}: {e}")
+                self._marcar(chave, 'erro')
+            with self.lock:
+                self._concluidos_lote += 1
+        self._fim_item()
+
+        # Delay (Rate Limit) por worker, como no loop do main.py
+        if resultado is not None and 'uso' in resultado:
+            time.sleep(PAUSA_ENTRE_ANALISES)
+
+    def _fim_item(self):
+        with self.lock:
+            self.versao += 1
+            regerar = self._snapshot_pendente and not self.em_andamento()
+            if regerar:
+                self._snapshot_pendente = False
+                resultados = dict(self.resultados)
+        if not regerar:
+            return
+
+        # Fim do lote: atualiza o snapshot do dashboard uma vez só, fora do lock (progresso e
+        # a tabela do dashboard não ficam travados enquanto a base inteira é relida do disco)
+        with self._snapshot_lock:
+            gerar_snapshot(perfil=self.perfil)
+        with self.lock:
+            # O snapshot já tem estes resultados: a sobreposição em memória não serve mais e
+            # ficaria valendo por cima de um reset da base. Resultados que chegaram depois ficam.
+            for chave, colunas in resultados.items():
+                if self.resultados.get(chave) is colunas:
+                    del self.resultados[chave]
+            self.versao += 1
+
+    def _gravar(self, chave, resultado):
+        salvar_relatorio(chave, resultado['Justificativa'], self.perfil)
+        with self.lock:
+            # A base (com todas as Justificativas) é lida, atualizada e descartada a cada
+            # resultado, para a memória do dashboard não crescer com o corpus de relatórios.
+            # O custo de reler o CSV é pequeno perto da análise LLM de cada professor.
+            df = carregar_base(self.perfil)
+            # `summerjob analyze`/reset mexeram na base no meio do caminho: refaz os agregados
+            garantir_agregados(df, self.perfil)
+            for index in df.index[df['Chave'] == chave]:
+                aplicar_resultado(df, index, resultado, self.perfil)
+            # SALVAMENTO INCREMENTAL, igual ao main.py
+            salvar_base(df, self.perfil)
+            self._snapshot_pendente = True
+            self.resultados[chave] = {c: resultado.get(c) for c in COLUNAS_RESULTADO}
+        try:
+            self.registro.salvar()
+        except Exception as e:
+            # O resultado já está gravado; perder uma atualização do backoff não é grave
+            logging.warning(f"Não foi possível salvar o registro de falhas: {e}")
@@ -0,0 +1,278 @@
+import pandas as pd
+import os
+import glob
+import logging
+import time
+from dotenv import load_dotenv
+from summerjob.config import DATA_PATH, ENV_FILE, MASTER_CSV, PERFIL_PADRAO, resultados_csv
+from summerjob.scraper import scrape_website
+from summerjob.analyzer import analyze_profile, eh_erro_de_cota
+from summerjob.respostas import extrair_score
+from summerjob.snapshot import gerar_snapshot
+from summerjob.falhas import RegistroFalhas
+from summerjob.base_mestra import carregar_base, garantir_agregados, salvar_base
+from summerjob.conteudo import ler_conteudo, salvar_conteudo
+from summerjob.perfis import carregar_perfil
+from summerjob import agregados
+# Configuração de Logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Pausa entre análises (Rate Limit da conta free do Gemini)
+PAUSA_ENTRE_ANALISES = 10 # Aumentei de 5 pra 10 pra dar mais fôlego à conta free
+
+def verificar_env():
+    load_dotenv(ENV_FILE)
+    if not os.getenv("GEMINI_API_KEY"):
+        print("❌ ERRO: A variável de ambiente GEMINI_API_KEY não foi encontrada.")
+        print(">> Crie um arquivo .env na raiz do projeto com o conteúdo:")
+        print("GEMINI_API_KEY=sua_chave_aqui")
+        return False
+    return True
+
+def analisar_professor(site, registro, on_fit=None, chave=None, perfil_candidato=None, rescrape=False):
+    """Scraping + análise LLM de um professor.
+
+    Com `chave`, o texto do site vem do cache de conteúdo (e é guardado lá após o
+    scraping), então cada site é baixado uma vez só, independente do perfil avaliado.
+    Retorna um dict com as colunas a atualizar na base mestra (mais `falha` ou `uso` para
+    diagnóstico), ou None se o host está em backoff. Erros de cota são propagados para
+    quem chamou decidir se para tudo.
+    """
+    texto_site = ler_conteudo(chave) if chave and not rescrape else None
+
+    if not texto_site:
+        # Host que já estourou o timeout nesta execução: nem tenta (e não conta como tentativa da linha)
+        if not registro.host_disponivel(site):
+            return None
+
+        texto_site = scrape_website(site, registro)
+
+        if not texto_site:
+            falha = registro.registrar_falha(site)
+            return {
+                'Fit': "Erro",
+                'Justificativa': f"Erro ao acessar site ({falha['tipo']})",
+                'falha': falha,
+            }
+
+        registro.registrar_sucesso(site)
+        if chave:
+            salvar_conteudo(chave, site, texto_site)
+
+    uso = {}
+    try:
+        relatorio, fit_categoria, uso = analyze_profile(texto_site, on_fit=on_fit, perfil_candidato=perfil_candidato)
+    except Exception as e:
+        if eh_erro_de_cota(e):
+            raise
+        logging.error(f"Erro inesperado ao analisar perfil: {e}")
+        relatorio = f"Erro na análise: {e}"
+        fit_categoria = "Erro"
+
+    return {
+        'Fit': fit_categoria,
+        'Justificativa': relatorio,
+        'Modelo': uso.get('modelo'),
+        'Tokens_Prompt': uso.get('tokens_prompt'),
+        'Tokens_Resposta': uso.get('tokens_resposta'),
+        'Score': extrair_score(relatorio) if fit_categoria != "Erro" else None,
+        'uso': uso,
+    }
+
+def resultado_de_erro(site, e):
+    """Resultado 'Erro' para uma exceção que não é de cota (bug no scraping, cache, etc.):
+    a linha fica marcada e o processamento segue com as demais."""
+    logging.error(f"Erro inesperado ao processar {site}: {e}")
+    return {'Fit': "Erro", 'Justificativa': f"Erro inesperado: {e}"}
+
+def aplicar_resultado(df_master, index, resultado, perfil=PERFIL_PADRAO):
+    """Grava no DataFrame as colunas de um resultado de `analisar_professor`
+    e atualiza os agregados incrementalmente (sai a linha antiga, entra a nova)."""
+    antes = df_master.loc[index].to_dict()
+    for col in ['Fit', 'Justificativa', 'Modelo', 'Tokens_Prompt', 'Tokens_Resposta', 'Score']:
+        if col in resultado:
+            df_master.at[index, col] = resultado[col]
+    agregados.atualizar(antes, df_master.loc[index].to_dict(), perfil, base=df_master)
+
+def carregar_e_processar_dados(ignorar_backoff=False, perfil=PERFIL_PADRAO, rescrape=False):
+    if not verificar_env():
+        return
+
+    try:
+        perfil_candidato = carregar_perfil(perfil)
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        return
+    print(f"👤 Perfil do candidato: {perfil}")
+
+    data_path = DATA_PATH
+    master_csv = MASTER_CSV
+    
+    # 1. Carrega ou Cria a Base Mestra
+    if os.path.exists(master_csv):
+        df_master = pd.read_csv(master_csv)
+        print(f"✅ Base de dados carregada: {len(df_master)} professores.")
+    else:
+        print("⚠️ Base de dados não encontrada. Execute `summerjob ingest` primeiro ou certifique-se que o arquivo existe.")
+        return
+
+    # 2. Verifica se há arquivos de 'novos' para processar (Opcional - Fluxo de Ingestão)
+    # Por enquanto, vamos assumir que queremos processar o que está FALTANDO na base mestra
+    # ou se o usuário adicionar um arquivo 'novos_professores.csv', nós mesclamos.
+    
+    arquivos_novos = glob.glob(os.path.join(data_path, 'novos_*.csv'))
+    if arquivos_novos:
+        print(f"📥 Encontrados {len(arquivos_novos)} arquivos de novos dados para ingestão.")
+        dfs_novos = []
+        for f in arquivos_novos:
+            try:
+                df_temp = pd.read_csv(f)
+                # Normalização básica de colunas
+                col_map = {c: c.capitalize() for c in df_temp.columns} # Ex: website -> Website
+                df_temp = df_temp.rename(columns=col_map)
+                dfs_novos.append(df_temp)
+            except: pass
+            
+        if dfs_novos:
+            df_novos = pd.concat(dfs_novos)
+            # Mescla com a master, removendo duplicatas pelo Website
+            df_combined = pd.concat([df_master, df_novos])
+            
+            # Remove duplicatas (mantendo o que já tinhamos na master preferencialmente, ou o novo se atualizar)
+            # Vamos manter o que tem mais informação. Se o da master já tem FIT, mantem a master.
+            # Lógica simplificada: Drop duplicates pelo Website
+            df_combined = df_combined.drop_duplicates(subset=['Website'], keep='first')
+            
+            if len(df_combined) > len(df_master):
+                print(f"➕ Adicionados {len(df_combined) - len(df_master)} novos professores à base.")
+                df_master = df_combined
+                df_master.to_csv(master_csv, index=False) # Salva estado atualizado
+    
+    # 3. Identifica processamento pendente na Base Mestra
+    # Critério: Fit é NaN ou vazio E Website é válido
+    # Os resultados (e o que está pendente) são do perfil escolhido; a base de professores é a mesma
+    df_master = carregar_base(perfil)
+    print(f"📄 Resultados do perfil em: {resultados_csv(perfil)}")
+
+    # Base alterada por fora (reset, ingestão, edição manual) ou primeira execução:
+    # os agregados são refeitos antes das atualizações incrementais
+    if garantir_agregados(df_master, perfil):
+        print("🔄 Agregados reconstruídos a partir da base.")
+
+    # Falhas de scraping anteriores (sites fora do ar/bloqueando ficam em backoff)
+    registro = RegistroFalhas(ignorar_backoff=ignorar_backoff)
+    em_backoff = 0
+
+    # Função auxiliar para verificar se precisa processar
+    def precisa_analisar(row):
+        nonlocal em_backoff
+        fit = str(row['Fit']).strip().lower()
+        if fit in ['nan', 'none', '']:
+            return True
+        if fit == 'erro':
+            if registro.pode_tentar(row['Website']):
+                return True
+            em_backoff += 1
+        return False
+
+    mask_pendentes = df_master.apply(precisa_analisar, axis=1)
+    df_pendentes = df_master[mask_pendentes]
+    
+    if em_backoff:
+        print(f"⏳ {em_backoff} professores com erro de acesso ainda em backoff (use --ignorar-backoff para forçar).")
+
+    if df_pendentes.empty:
+        print("🎉 Todos os professores da base já foram analisados!")
+        return
+
+    print(f"🔨 Iniciando análise para {len(df_pendentes)} professores pendentes...\n")
+    
+    alteracoes = False
+    total = len(df_pendentes)
+    tokens_total = {'prompt': 0, 'resposta': 0}
+    
+    # Itera apenas sobre os pendentes
+    for count, (index, row) in enumerate(df_pendentes.iterrows()):
+        site = row['Website']
+        nome = row.get('Professor', 'Desconhecido')
+        
+        print(f"[{count+1}/{total}] Analisando {nome}...", end='\r')
+        
+        if pd.isna(site) or "http" not in str(site):
+            print(f"\n   ⏩ Pulo: URL inválida ({site})")
+            continue
+
+        def avisar_fit(fit):
+            print(f"\n   🎯 {nome}: {fit} (gerando relatório...)", end='\r')
+
+        try:
+            resultado = analisar_professor(site, registro, on_fit=avisar_fit, chave=row['Chave'],
+                                           perfil_candidato=perfil_candidato, rescrape=rescrape)
+        except Exception as e:
+            if not eh_erro_de_cota(e):
+                resultado = resultado_de_erro(site, e)
+            else:
+                print(f"\n✋ Cota excedida detectada! Salvando progresso e parando o script.")
+                salvar_base(df_master, perfil)
+                registro.salvar()
+                return # Encerra o processamento
+
+        if resultado is None:
+            print(f"\n   ⏭️ Pulo: host em backoff ({site})")
+            continue
+
+        aplicar_resultado(df_master, index, resultado, perfil)
+        alteracoes = True
+
+        if 'falha' in resultado or 'uso' not in resultado:
+            if 'falha' in resultado:
+                falha = resultado['falha']
+                print(f"\n   ⚠️ Falha ao ler site ({falha['tipo']}, tentativa {falha['tentativas']}): {site}")
+                print(f"      Próxima tentativa a partir de {falha['proxima_tentativa']}")
+            else:
+                print(f"\n   ❌ {resultado['Justificativa']} ({site})")
+            try:
+                salvar_base(df_master, perfil)
+                registro.salvar()
+            except: pass
+            continue
+
+        fit_categoria = resultado['Fit']
+        uso = resultado['uso']
+
+        if fit_categoria == "Erro":
+            print(f"\n   ❌ Erro na API do Gemini para {site}")
+            # Se deu erro no Gemini, também queremos salvar o status de erro se ele retornou algo
+
+        if uso.get('modelo'):
+            tokens_total['prompt'] += uso.get('tokens_prompt') or 0
+            tokens_total['resposta'] += uso.get('tokens_resposta') or 0
+            print(f"\n   ✅ {fit_categoria} via {uso['modelo']} em {uso['tempo']:.1f}s "
+                  f"({uso.get('tokens_prompt')} tokens de prompt / {uso.get('tokens_resposta')} de resposta)")
+
+        # SALVAMENTO INCREMENTAL (Segurança contra falhas/Ctrl+C)
+        try:
+            salvar_base(df_master, perfil)
+            # print(f"      💾 Progresso salvo.")
+        except Exception as save_err:
+            print(f"      ❌ Erro ao salvar progresso: {save_err}")
+        
+        # Delay (Rate Limit)
+        time.sleep(PAUSA_ENTRE_ANALISES)
+
+    print("")
+    registro.salvar()
+    if tokens_total['prompt'] or tokens_total['resposta']:
+        print(f"🧮 Tokens nesta execução: {tokens_total['prompt']} de prompt / {tokens_total['resposta']} de resposta")
+    if alteracoes:
+        salvar_base(df_master, perfil)
+        print(f"💾 Base de dados atualizada com sucesso: {resultados_csv(perfil)}")
+        # Atualiza o snapshot do dashboard já a partir da memória (evita reler o CSV)
+        gerar_snapshot(df_master, perfil)
+    
+    # Não precisa mais consolidar, pois já trabalhamos na base única
+
+# Função consolidar removida pois obsoleta
+
+if __name__ == "__main__":
+    carregar_e_processar_dados()
@@ -1,11 +1,11 @@
 import pandas as pd
 import glob
 import os
+from summerjob.config import DATA_PATH, MASTER_CSV
 
 def migrate_to_master():
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    data_path = os.path.join(base_path, '..', 'data')
-    master_path = os.path.join(data_path, 'base_professores.csv')
+    data_path = DATA_PATH
+    master_path = MASTER_CSV
     
     # Arquivos antigos
     csv_files = glob.glob(os.path.join(data_path, 'professores_data*.csv'))
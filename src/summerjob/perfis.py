@@ -0,0 +1,20 @@
+"""Perfis de candidato: um arquivo Markdown por perfil em data/perfis/, com o texto que entra no prompt."""
+import os
+
+from summerjob.config import PERFIS_PATH, PERFIL_PADRAO, perfil_md
+
+def listar_perfis():
+    """Nomes dos perfis de candidato disponíveis (arquivos .md em data/perfis/)."""
+    if not os.path.isdir(PERFIS_PATH):
+        return [PERFIL_PADRAO]
+    nomes = sorted(f[:-3] for f in os.listdir(PERFIS_PATH) if f.endswith('.md'))
+    # O padrão sempre aparece primeiro
+    return sorted(nomes, key=lambda n: n != PERFIL_PADRAO)
+
+def carregar_perfil(perfil=PERFIL_PADRAO):
+    """Texto do perfil do candidato que entra no prompt da análise."""
+    caminho = perfil_md(perfil)
+    if not os.path.exists(caminho):
+        raise FileNotFoundError(f"Perfil '{perfil}' não encontrado: crie {caminho}")
+    with open(caminho, encoding='utf-8') as f:
+        return f.read()
@@ -0,0 +1,42 @@
+import pandas as pd
+import os
+import shutil
+from summerjob.base_mestra import COLUNAS_RESULTADO, migrar_resultados_padrao
+from summerjob.config import PERFIL_PADRAO, resultados_csv
+
+def reset_and_clean_master(perfil=PERFIL_PADRAO):
+    if perfil == PERFIL_PADRAO:
+        migrar_resultados_padrao()
+    master_csv = resultados_csv(perfil)
+    
+    if not os.path.exists(master_csv):
+        print(f"❌ Arquivo {os.path.basename(master_csv)} não encontrado.")
+        return
+
+    # Backup antes de mexer
+    shutil.copy(master_csv, master_csv + ".bak")
+    print(f"📦 Backup criado: {os.path.basename(master_csv)}.bak")
+
+    df = pd.read_csv(master_csv)
+    print(f"📊 Total de registros antes: {len(df)}")
+    
+    # Colunas que queremos resetar para forçar reanálise: todas as de resultado
+    # (Score, Modelo e tokens saem da análise, então vão junto; senão os agregados
+    # mantêm a média e o modelo antigos). Os dados do professor ficam.
+    cols_to_reset = COLUNAS_RESULTADO
+    
+    # 1. Limpa valores manuais antigos (High, Low, etc)
+    # 2. Limpa valores atuais para forçar reprocessamento com novo scraper
+    #    Vamos limpar TUDO para garantir que todos passem pelo novo scraper V2
+    
+    print(f"🧹 Limpando colunas de resultado ({', '.join(cols_to_reset)}) do perfil '{perfil}' para reprocessamento total...")
+    for col in cols_to_reset:
+        df[col] = None
+    
+    df.to_csv(master_csv, index=False)
+    print("✅ Base resetada com sucesso! Rode 'summerjob analyze' para reprocessar.")
+    # O conteúdo dos sites continua no cache: a reanálise só chama o LLM
+    print("   (o texto dos sites vem do cache; use 'summerjob analyze --rescrape' para baixar de novo)")
+
+if __name__ == "__main__":
+    reset_and_clean_master()
@@ -0,0 +1,48 @@
+"""
+Leitura das respostas do modelo: classificação de Fit e Score de Compatibilidade.
+
+Sem efeitos colaterais no import (nada de .env nem SDK do Gemini), para quem só lê
+relatórios já gravados, como os agregados, não precisar carregar o analyzer.
+"""
+import re
+
+# Ordem importa: verificar "muito" antes do simples
+FIT_CATEGORIES = ["Fit Muito Alto", "Fit Alto", "Fit Muito Baixo", "Fit Baixo"]
+
+def extrair_fit(texto, final=True):
+    """Extrai a classificação do texto (parcial ou completo) da resposta.
+
+    Procura primeiro a linha "Classificação Final"; com `final=True` cai no método antigo
+    (qualquer menção no texto) e no default conservador "Fit Baixo".
+    """
+    lower_resp = texto.lower()
+    # Em texto parcial (streaming), só olha linhas completas para não pegar "Fit Muito" pela metade
+    linhas = lower_resp.splitlines() if final else lower_resp[:lower_resp.rfind('\n') + 1].splitlines()
+
+    for linha in linhas:
+        if "classificação final" in linha or "classificacao final" in linha:
+            for categoria in FIT_CATEGORIES:
+                if categoria.lower() in linha:
+                    return categoria
+
+    if not final:
+        return None
+
+    for categoria in FIT_CATEGORIES:
+        if categoria.lower() in lower_resp:
+            return categoria
+    return "Fit Baixo" # Valor default conservador se a IA falhar na formatação
+
+def extrair_score(texto):
+    """Extrai o "Score de Compatibilidade" (0-100) do relatório, ou None se não houver."""
+    if not isinstance(texto, str):
+        return None
+    for linha in texto.lower().splitlines():
+        if "score" not in linha:
+            continue
+        # Ignora a faixa "(0-100%)" que às vezes o modelo repete do prompt
+        linha = re.sub(r'0\s*-\s*100\s*%', '', linha)
+        valores = re.findall(r'(\d{1,3})(?:[.,]\d+)?\s*%', linha)
+        if valores and 0 <= int(valores[-1]) <= 100:
+            return int(valores[-1])
+    return None
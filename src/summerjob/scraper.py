@@ -1,18 +1,46 @@
 import requests
 from bs4 import BeautifulSoup
 import logging
+import time
 from urllib.parse import urljoin, urlparse
+from summerjob.falhas import classificar_erro
+
+def get_text_from_url(url, registro=None, stats=None, principal=True):
+    """Auxiliar: Baixa e limpa o texto de uma URL.
+
+    Se receber um `RegistroFalhas`, pula hosts em backoff e registra o tipo de cada falha
+    (`principal=False` para sub-páginas: essas falhas não contam para o backoff do host).
+    Se receber uma lista `stats`, adiciona nela as métricas da requisição (diagnóstico).
+    """
+    if registro is not None and not registro.host_disponivel(url):
+        logging.info(f"⏭️  Host em backoff, pulando: {url}")
+        registro.ultimo_erro[url] = 'host_em_backoff'
+        return None, ""
+
+    metrica = {'url': url, 'status': None, 'bytes': 0, 't_fetch': 0.0, 't_parse': 0.0,
+               'chars': 0, 'scripts': 0, 'erro': None, 'aproveitada': False}
+    if stats is not None:
+        stats.append(metrica)
 
-def get_text_from_url(url):
-    """Auxiliar: Baixa e limpa o texto de uma URL."""
     try:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
-        response = requests.get(url, headers=headers, timeout=10)
+        t0 = time.perf_counter()
+        try:
+            response = requests.get(url, headers=headers, timeout=10)
+        finally:
+            # Mede também timeouts e conexões recusadas (são justamente os sites lentos)
+            metrica['t_fetch'] = time.perf_counter() - t0
+        metrica['status'] = response.status_code
+        metrica['bytes'] = len(response.content)
         response.raise_for_status()
+        if registro is not None:
+            registro.registrar_sucesso_requisicao(url)
         
+        t0 = time.perf_counter()
         soup = BeautifulSoup(response.content, 'html.parser')
+        metrica['scripts'] = len(soup.find_all('script'))
         
         # Remove scripts e estilos
         for script in soup(["script", "style", "nav", "footer", "iframe"]):
@@ -24,13 +52,18 @@ def get_text_from_url(url):
         lines = (line.strip() for line in text.splitlines())
         chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
         clean_text = '\n'.join(chunk for chunk in chunks if chunk)
+        metrica['t_parse'] = time.perf_counter() - t0
+        metrica['chars'] = len(clean_text)
         
         return soup, clean_text
     except Exception as e:
         logging.warning(f"Erro ao acessar {url}: {e}")
+        metrica['erro'] = classificar_erro(e)
+        if registro is not None:
+            registro.registrar_falha_requisicao(url, metrica['erro'], principal)
         return None, ""
 
-def scrape_website(url):
+def scrape_website(url, registro=None, stats=None):
     """
     Scraper Inteligente V2:
     1. Baixa a página principal.
@@ -43,7 +76,7 @@ def scrape_website(url):
     logging.info(f"🔍 Scraping: {url}")
     
     # 1. Página Principal
-    soup_main, text_main = get_text_from_url(url)
+    soup_main, text_main = get_text_from_url(url, registro, stats)
     
     if not soup_main:
         return None
@@ -108,13 +141,16 @@ def scrape_website(url):
             if full_url in visited_links: continue
                 
             logging.info(f"   ↳ Aprofundando em: {full_url}")
-            _, sub_text = get_text_from_url(full_url)
+            _, sub_text = get_text_from_url(full_url, registro, stats, principal=False)
             
             # Só adiciona se trouxer conteúdo novo relevante
             if sub_text and len(sub_text) > 200:
                 extra_content.append(f"\n--- CONTEÚDO EXTRA ({text_link.upper()}) ---\nLink: {full_url}\n{sub_text}")
                 visited_links.add(full_url)
                 found_relevant_links += 1
+                if stats:
+                    # A métrica desta sub-página é a última adicionada por get_text_from_url
+                    stats[-1]['aproveitada'] = True
 
     # Junta tudo
     if extra_content:
@@ -0,0 +1,121 @@
+"""
+Snapshot colunar da base mestra para o dashboard (um por perfil de candidato,
+em data/snapshot/<perfil>/).
+
+- `professores.parquet`: só metadados compactos (Fit/Universidade como categóricos),
+  lido com memory-map, sem os relatórios longos do LLM.
+- `relatorios.sqlite`: os textos de `Justificativa`, lidos um por vez pela chave do professor.
+
+Assim a memória e o payload do dashboard não crescem junto com o corpus de relatórios.
+"""
+import os
+import sqlite3
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from summerjob import agregados
+from summerjob.base_mestra import carregar_base, chave_professor, garantir_agregados, mtime_base
+from summerjob.config import MASTER_CSV, PERFIL_PADRAO, snapshot_path, snapshot_parquet, relatorios_db
+
+COLUNAS_METADADOS = ['Chave', 'Professor', 'Universidade', 'Area', 'Website', 'Email', 'Fit',
+                     'Score', 'Modelo', 'Tokens_Prompt', 'Tokens_Resposta']
+COLUNAS_CATEGORICAS = ['Universidade', 'Fit', 'Modelo']
+COLUNAS_NUMERICAS = ['Score', 'Tokens_Prompt', 'Tokens_Resposta']
+
+def snapshot_desatualizado(perfil=PERFIL_PADRAO):
+    """True se o Parquet não existe ou é mais antigo que a base do perfil."""
+    if not os.path.exists(snapshot_parquet(perfil)) or not os.path.exists(relatorios_db(perfil)):
+        return True
+    if not os.path.exists(MASTER_CSV):
+        return False
+    return os.path.getmtime(snapshot_parquet(perfil)) < mtime_base(perfil)
+
+def gerar_snapshot(df=None, perfil=PERFIL_PADRAO):
+    """Gera o Parquet de metadados e atualiza o repositório de relatórios a partir da base do perfil.
+
+    `df`, se passado, deve ser a base como acabou de ser gravada. Se os agregados não
+    estão em dia com ela (base alterada por fora dos caminhos incrementais: reset,
+    ingestão, edição manual), eles são reconstruídos.
+    """
+    if df is None:
+        df = carregar_base(perfil)
+        if df is None:
+            return None
+
+    os.makedirs(snapshot_path(perfil), exist_ok=True)
+
+    df = df.copy()
+    for c in COLUNAS_METADADOS[1:] + ['Justificativa']:
+        if c not in df.columns:
+            df[c] = None
+    df['Chave'] = [chave_professor(p, w) for p, w in zip(df['Professor'], df['Website'])]
+    # Linhas antigas não têm Score: extrai do relatório
+    df['Score'] = [agregados.score_da_linha(linha) for linha in df[['Score', 'Justificativa']].to_dict('records')]
+
+    garantir_agregados(df, perfil)
+
+    # 1. Relatórios: um registro por chave (upsert), fora do Parquet
+    with sqlite3.connect(relatorios_db(perfil)) as conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS relatorios (chave TEXT PRIMARY KEY, texto TEXT)")
+        relatorios = [
+            (chave, str(texto))
+            for chave, texto in zip(df['Chave'], df['Justificativa'])
+            if pd.notna(texto)
+        ]
+        sem_relatorio = [(chave,) for chave, texto in zip(df['Chave'], df['Justificativa']) if pd.isna(texto)]
+        conn.executemany("INSERT OR REPLACE INTO relatorios (chave, texto) VALUES (?, ?)", relatorios)
+        # Linhas resetadas (Justificativa vazia) não devem manter o relatório antigo
+        conn.executemany("DELETE FROM relatorios WHERE chave = ?", sem_relatorio)
+
+    # 2. Metadados: colunas compactas, categóricas onde há poucos valores distintos
+    meta = df[COLUNAS_METADADOS].copy()
+    for c in COLUNAS_METADADOS:
+        if c in COLUNAS_NUMERICAS:
+            meta[c] = pd.to_numeric(meta[c], errors='coerce').astype('Int64')
+        elif c not in COLUNAS_CATEGORICAS:
+            meta[c] = meta[c].astype('string')
+    for c in COLUNAS_CATEGORICAS:
+        meta[c] = meta[c].astype('string').astype('category')
+
+    # Escreve num temporário e troca, para o dashboard nunca ler um arquivo pela metade
+    parquet = snapshot_parquet(perfil)
+    tmp_path = parquet + '.tmp'
+    pq.write_table(pa.Table.from_pandas(meta, preserve_index=False), tmp_path)
+    os.replace(tmp_path, parquet)
+    return meta
+
+def ler_metadados(perfil=PERFIL_PADRAO):
+    """Lê o Parquet de metadados como está (memory-mapped), sem checar a base mestra."""
+    tabela = pq.read_table(snapshot_parquet(perfil), memory_map=True)
+    return tabela.to_pandas()
+
+def carregar_metadados(perfil=PERFIL_PADRAO):
+    """Lê o Parquet de metadados, regenerando-o antes se a base do perfil mudou."""
+    if snapshot_desatualizado(perfil):
+        if gerar_snapshot(perfil=perfil) is None:
+            return None
+    return ler_metadados(perfil)
+
+def salvar_relatorio(chave, texto, perfil=PERFIL_PADRAO):
+    """Grava (ou atualiza) o relatório de um único professor no repositório de relatórios."""
+    os.makedirs(snapshot_path(perfil), exist_ok=True)
+    with sqlite3.connect(relatorios_db(perfil)) as conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS relatorios (chave TEXT PRIMARY KEY, texto TEXT)")
+        conn.execute("INSERT OR REPLACE INTO relatorios (chave, texto) VALUES (?, ?)", (chave, str(texto)))
+
+def ler_relatorio(chave, perfil=PERFIL_PADRAO):
+    """Busca o relatório completo de um professor pela chave (None se não houver)."""
+    if not os.path.exists(relatorios_db(perfil)):
+        return None
+    with sqlite3.connect(relatorios_db(perfil)) as conn:
+        linha = conn.execute("SELECT texto FROM relatorios WHERE chave = ?", (chave,)).fetchone()
+    return linha[0] if linha else None
+
+if __name__ == "__main__":
+    meta = gerar_snapshot()
+    if meta is None:
+        print(f"❌ Base mestra não encontrada: {MASTER_CSV}")
+    else:
+        print(f"✅ Snapshot gerado: {len(meta)} professores em {snapshot_parquet()}")